@@ -16,24 +16,45 @@ Key Insight:
 
 Algorithm:
 1. Build implication graph from clauses
-2. Find strongly connected components (SCCs) using Kosaraju's algorithm
+2. Find strongly connected components (SCCs) using Tarjan's algorithm
 3. Check if any variable x and NOT x are in the same SCC
    - If yes: unsatisfiable (contradiction)
-   - If no: satisfiable
+   - If no: satisfiable, and x = True iff comp[x] < comp[NOT x]
 
 Time Complexity: O(V + E) where V = 2n variables, E = 2m edges
 Space Complexity: O(V + E)
 
 Functions:
-- implication_graph: Convert 2-SAT clauses to implication graph
-- two_sat_solver: Check if 2-SAT instance is satisfiable
-- kosaraju_scc: Find strongly connected components
+- literal_index: Encode a signed literal as an implication-graph vertex index
+- implication_graph: Convert 2-SAT clauses to a CSR implication graph
+- two_sat_solver: Find a satisfying assignment, or None if unsatisfiable
+- has_short_contradiction: Bounded search for an obvious x <=> NOT x cycle
+- tarjan_scc: Find strongly connected components
+- TwoSATState: Incremental instance that caches SCCs across added clauses
 """
 
-from typing import List, Tuple, Dict
-from collections import defaultdict
+from array import array
+from typing import Iterable, List, Optional, Tuple
 
-def implication_graph(clauses: List[Tuple[int, int]], num_vars: int) -> Dict[int, List[int]]:
+CSRGraph = Tuple[array, array]
+
+# Limits for the cheap contradiction pre-pass in two_sat_solver
+PRECHECK_MAX_DEGREE = 8
+PRECHECK_MAX_DEPTH = 4
+
+
+def literal_index(literal: int) -> int:
+    """
+    Map a signed literal to its vertex index in the implication graph.
+
+    Variable x (1-based) owns vertices 2*(x-1) for x and 2*(x-1)+1 for NOT x,
+    so the complement of any literal index i is simply i ^ 1. The sign bit
+    is folded in without branching: (|x| - 1) << 1, OR-ed with (x < 0).
+    """
+    return ((abs(literal) - 1) << 1) | (literal < 0)
+
+
+def implication_graph(clauses: List[Tuple[int, int]], num_vars: int) -> CSRGraph:
     """
     Construct the implication graph from 2-SAT clauses.
     
@@ -42,32 +63,101 @@ def implication_graph(clauses: List[Tuple[int, int]], num_vars: int) -> Dict[int
     - NOT b => a  (if b is false, a must be true)
     
     Variable representation:
-    - Positive literal x is represented as x
-    - Negative literal NOT x is represented as -x
+    - Literals are encoded with literal_index(): x -> 2*(x-1), NOT x -> 2*(x-1)+1
+    - The negation of literal index i is i ^ 1
+
+    The graph is stored in CSR (compressed sparse row) form: the neighbours
+    of vertex u are indices[indptr[u]:indptr[u + 1]].
 
     Args:
         clauses: List of clauses, each clause is (literal1, literal2)
-        num_vars: Number of Boolean variables (not used, kept for API consistency)
+        num_vars: Number of Boolean variables
 
     Returns:
-        Implication graph as adjacency list
+        Implication graph as an (indptr, indices) pair of int arrays
         
+    Raises:
+        ValueError: If a clause refers to a variable outside 1..num_vars
+
     Example:
         clause (x1 OR x2) creates edges: -x1 -> x2 and -x2 -> x1
         clause (x1 OR NOT x2) creates edges: -x1 -> -x2 and x2 -> x1
     """
-    graph: Dict[int, List[int]] = defaultdict(list)
+    return _build_csr(clauses, num_vars)
+
+def _build_csr(clauses: List[Tuple[int, int]], num_vars: int) -> CSRGraph:
+    """
+    Fused clause -> CSR construction used on the solver's hot path.
+
+    One pass over the clauses writes both implication edges straight into
+    preallocated edge arrays and counts out-degrees at the same time; a single
+    prefix-sum + scatter then produces the CSR arrays.
+    """
+    num_lits = 2 * num_vars
+    sources = array('i', bytes(8 * len(clauses)))
+    targets = array('i', bytes(8 * len(clauses)))
+    indptr = array('i', bytes(4 * (num_lits + 1)))
 
+    edge = 0
     for a, b in clauses:
+        if not (0 < abs(a) <= num_vars and 0 < abs(b) <= num_vars):
+            raise ValueError(f"Clause ({a}, {b}) refers to a variable outside 1..{num_vars}")
+        # literal_index() inlined: branchless sign-bit encoding
+        lit_a = ((abs(a) - 1) << 1) | (a < 0)
+        lit_b = ((abs(b) - 1) << 1) | (b < 0)
         # Clause (a OR b) => implications: NOT a => b and NOT b => a
-        graph[-a].append(b)
-        graph[-b].append(a)
+        u = lit_a ^ 1
+        sources[edge] = u
+        targets[edge] = lit_b
+        indptr[u + 1] += 1
+        u = lit_b ^ 1
+        sources[edge + 1] = u
+        targets[edge + 1] = lit_a
+        indptr[u + 1] += 1
+        edge += 2
 
-    return dict(graph)
+    return _scatter_csr(indptr, sources, targets, num_lits)
 
-def two_sat_solver(clauses: List[Tuple[int, int]], num_vars: int) -> bool:
+def _append_clause_edges(clauses: Iterable[Tuple[int, int]], num_vars: int,
+                         sources: array, targets: array) -> None:
+    """Append the two implication edges of every clause to the edge arrays."""
+    for a, b in clauses:
+        if not (0 < abs(a) <= num_vars and 0 < abs(b) <= num_vars):
+            raise ValueError(f"Clause ({a}, {b}) refers to a variable outside 1..{num_vars}")
+        lit_a = literal_index(a)
+        lit_b = literal_index(b)
+        # Clause (a OR b) => implications: NOT a => b and NOT b => a
+        sources.append(lit_a ^ 1)
+        targets.append(lit_b)
+        sources.append(lit_b ^ 1)
+        targets.append(lit_a)
+
+def _edges_to_csr(sources: array, targets: array, num_lits: int) -> CSRGraph:
+    """Bucket an edge list by source into CSR arrays with one counting sort."""
+    # Counting pass: out-degree of every literal
+    indptr = array('i', bytes(4 * (num_lits + 1)))
+    for u in sources:
+        indptr[u + 1] += 1
+    return _scatter_csr(indptr, sources, targets, num_lits)
+
+def _scatter_csr(indptr: array, sources: array, targets: array, num_lits: int) -> CSRGraph:
+    """Finish a CSR build: prefix-sum the counted degrees in indptr, then scatter targets."""
+    for u in range(num_lits):
+        indptr[u + 1] += indptr[u]
+
+    # Scatter pass: place each target at its source's running position
+    indices = array('i', bytes(4 * len(targets)))
+    position = indptr[:num_lits]
+    for u, v in zip(sources, targets):
+        indices[position[u]] = v
+        position[u] += 1
+
+    return indptr, indices
+
+def two_sat_solver(num_vars: int, clauses: List[Tuple[int, int]],
+                   precheck: bool = True) -> Optional[List[bool]]:
     """
-    Determine if a 2-SAT instance is satisfiable.
+    Solve a 2-SAT instance, returning a satisfying assignment if one exists.
     
     The key insight: A 2-SAT formula is unsatisfiable if and only if
     there exists a variable x such that x and NOT x are in the same
@@ -78,96 +168,249 @@ def two_sat_solver(clauses: List[Tuple[int, int]], num_vars: int) -> bool:
     - NOT x => x (x being false implies x must be true)
     This is a contradiction!
 
+    Tarjan's algorithm numbers SCCs in reverse topological order, so when
+    the formula is satisfiable, setting x = True exactly when comp[x] <
+    comp[NOT x] (x's component comes later in topological order) yields a
+    valid assignment.
+
+    Before running the full SCC pass, an optional pre-pass looks for short
+    contradictions: for every low-degree variable it runs a depth-bounded BFS
+    from x and from NOT x, and if x => ... => NOT x and NOT x => ... => x are
+    both found the formula is rejected without computing any SCCs.
+
     Args:
-        clauses: List of clauses, each clause is (literal1, literal2)
         num_vars: Number of Boolean variables
+        clauses: List of clauses, each clause is (literal1, literal2)
+        precheck: Run the bounded contradiction pre-pass first (default True)
 
     Returns:
-        True if satisfiable, False otherwise
+        List of num_vars booleans (index i holds x_{i+1}) if satisfiable,
+        None otherwise
         
     Time Complexity: O(n + m) where n = variables, m = clauses
     """
-    # Build implication graph
-    graph = implication_graph(clauses, num_vars)
+    # Build implication graph (fused clause scan + CSR construction)
+    graph = _build_csr(clauses, num_vars)
+
+    # Cheap pre-pass: short implication cycles through x and NOT x
+    if precheck and has_short_contradiction(graph, num_vars):
+        return None
     
     # Find strongly connected components
-    sccs = kosaraju_scc(graph)
+    comp_id = tarjan_scc(graph)
 
-    # Map each literal to its SCC ID
-    component_id: Dict[int, int] = {}
-    for idx, component in enumerate(sccs):
-        for node in component:
-            component_id[node] = idx
+    return _read_assignment(comp_id, num_vars)
 
-    # Check for contradictions
-    for var in range(1, num_vars + 1):
+def _read_assignment(comp_id: array, num_vars: int) -> Optional[List[bool]]:
+    """Turn Tarjan SCC ids into an assignment, or None if some x shares an SCC with NOT x."""
+    # Check for contradictions and read off the assignment in one scan.
+    # Literals that never occur in a clause are isolated vertices, which
+    # Tarjan still gives their own singleton SCC, so no special case is needed.
+    assignment: List[bool] = []
+    for lit in range(0, 2 * num_vars, 2):
+        comp = comp_id[lit]
+        neg_comp = comp_id[lit ^ 1]
         # If variable and its negation are in same SCC => unsatisfiable
-        var_comp = component_id.get(var, -1)
-        neg_var_comp = component_id.get(-var, -1)
-        
-        if var_comp != -1 and var_comp == neg_var_comp:
-            return False
+        if comp == neg_comp:
+            return None
+        assignment.append(comp < neg_comp)
 
-    return True
+    return assignment
 
-def kosaraju_scc(graph: Dict[int, List[int]]) -> List[List[int]]:
+def has_short_contradiction(graph: CSRGraph, num_vars: int,
+                            max_degree: int = PRECHECK_MAX_DEGREE,
+                            max_depth: int = PRECHECK_MAX_DEPTH) -> bool:
     """
-    Find strongly connected components using Kosaraju's algorithm.
+    Look for a variable x with x => NOT x and NOT x => x along short paths.
+
+    Only variables whose two literals have at most max_degree outgoing
+    implications in total are examined, and each search stops after max_depth
+    BFS layers. A True result proves unsatisfiability; False proves nothing.
+
+    Args:
+        graph: Implication graph in CSR form
+        num_vars: Number of Boolean variables
+        max_degree: Skip variables whose literals have more out-edges than this
+        max_depth: Maximum path length explored from each literal
+
+    Returns:
+        True if a contradiction was found within the bounds, False otherwise
+    """
+    indptr, indices = graph
+
+    def reaches_within(source: int, target: int) -> bool:
+        seen = {source}
+        frontier = [source]
+        for _ in range(max_depth):
+            next_frontier: List[int] = []
+            for u in frontier:
+                for pos in range(indptr[u], indptr[u + 1]):
+                    v = indices[pos]
+                    if v == target:
+                        return True
+                    if v not in seen:
+                        seen.add(v)
+                        next_frontier.append(v)
+            if not next_frontier:
+                return False
+            frontier = next_frontier
+        return False
+
+    for lit in range(0, 2 * num_vars, 2):
+        if indptr[lit + 2] - indptr[lit] > max_degree:
+            continue
+        if reaches_within(lit, lit ^ 1) and reaches_within(lit ^ 1, lit):
+            return True
+
+    return False
+
+def tarjan_scc(graph: CSRGraph) -> array:
+    """
+    Find strongly connected components using an iterative Tarjan's algorithm.
+
+    Unlike Kosaraju, this needs a single DFS and no reversed graph. Each
+    vertex gets a DFS index and a lowlink (smallest index reachable through
+    its DFS subtree and one back edge); a vertex whose lowlink equals its own
+    index is the root of an SCC, which is then popped off the SCC stack.
     
     Args:
-        graph: Adjacency list representing the directed graph
+        graph: Directed graph in CSR form, as returned by implication_graph
         
     Returns:
-        List of SCCs, where each SCC is a list of node IDs
+        Array mapping each vertex to its SCC ID; IDs are assigned in
+        reverse topological order of the condensation (sinks first)
         
     Time Complexity: O(V + E)
     """
-    from typing import Set
-    
-    def dfs_first(node: int, visited: Set[int], stack: List[int]) -> None:
-        visited.add(node)
-        for neighbor in graph.get(node, []):
-            if neighbor not in visited:
-                dfs_first(neighbor, visited, stack)
-        stack.append(node)
-
-    def dfs_second(node: int, visited: Set[int], component: List[int], 
-                   rev_graph: Dict[int, List[int]]) -> None:
-        visited.add(node)
-        component.append(node)
-        for neighbor in rev_graph.get(node, []):
-            if neighbor not in visited:
-                dfs_second(neighbor, visited, component, rev_graph)
-
-    def reverse_graph(g: Dict[int, List[int]]) -> Dict[int, List[int]]:
-        reversed_g: Dict[int, List[int]] = defaultdict(list)
-        for node in g:
-            for neighbor in g[node]:
-                reversed_g[neighbor].append(node)
-        return dict(reversed_g)
-
-    # First DFS pass
-    visited: Set[int] = set()
-    stack: List[int] = []
-    for node in graph:
-        if node not in visited:
-            dfs_first(node, visited, stack)
-
-    # Reverse graph
-    reversed_graph = reverse_graph(graph)
-    
-    # Second DFS pass
-    sccs: List[List[int]] = []
-    visited.clear()
+    indptr, indices = graph
+    return _tarjan_scc_kernel(indptr, indices, len(indptr) - 1)
+
+def _tarjan_scc_kernel(indptr: array, indices: array, n: int) -> array:
+    """
+    Integer-only Tarjan core over CSR arrays.
+
+    Every piece of state lives in a preallocated int array of length n: the
+    DFS call stack is split into work_v/work_pos with a top pointer, and the
+    SCC stack uses its own pointer, so the loop allocates nothing per edge.
+    """
+    index = array('i', [-1]) * n
+    lowlink = array('i', bytes(4 * n))
+    on_stack = bytearray(n)
+    comp_id = array('i', [-1]) * n
+    scc_stack = array('i', bytes(4 * n))
+    work_v = array('i', bytes(4 * n))
+    work_pos = array('i', bytes(4 * n))
+    scc_top = 0
+    counter = 0
+    num_comps = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+
+        index[root] = lowlink[root] = counter
+        counter += 1
+        scc_stack[scc_top] = root
+        scc_top += 1
+        on_stack[root] = 1
+        work_v[0] = root
+        work_pos[0] = indptr[root]
+        top = 0
+
+        while top >= 0:
+            v = work_v[top]
+            pos = work_pos[top]
+            if pos < indptr[v + 1]:
+                # Advance v's neighbour cursor before descending
+                work_pos[top] = pos + 1
+                w = indices[pos]
+                if index[w] == -1:
+                    index[w] = lowlink[w] = counter
+                    counter += 1
+                    scc_stack[scc_top] = w
+                    scc_top += 1
+                    on_stack[w] = 1
+                    top += 1
+                    work_v[top] = w
+                    work_pos[top] = indptr[w]
+                elif on_stack[w] and index[w] < lowlink[v]:
+                    lowlink[v] = index[w]
+                continue
+
+            # All neighbours of v explored: propagate lowlink to the parent
+            top -= 1
+            if top >= 0:
+                parent = work_v[top]
+                if lowlink[v] < lowlink[parent]:
+                    lowlink[parent] = lowlink[v]
+
+            if lowlink[v] == index[v]:
+                while True:
+                    scc_top -= 1
+                    w = scc_stack[scc_top]
+                    on_stack[w] = 0
+                    comp_id[w] = num_comps
+                    if w == v:
+                        break
+                num_comps += 1
+
+    return comp_id
+
+class TwoSATState:
+    """
+    A 2-SAT instance that can grow clause by clause and be re-solved cheaply.
+
+    The implication edges are kept as flat source/target arrays, the CSR graph
+    is rebuilt lazily (one counting sort) only when it is needed, and the
+    Tarjan SCC ids from the last solve() are cached. Tarjan numbers SCCs in
+    reverse topological order, so a new edge u -> v with comp[u] >= comp[v]
+    either stays inside an SCC or agrees with the existing order: it cannot
+    merge components, and the cached ids (and the assignment read from them)
+    remain valid. Only an edge pointing "backwards" (comp[u] < comp[v])
+    invalidates the cache.
+
+    Typical reuse pattern:
+        state = TwoSATState(num_vars, clauses)
+        state.solve()
+        state.add_clauses(more_clauses)   # often keeps the cached SCCs
+        state.solve()                     # free if nothing was invalidated
+    """
+
+    def __init__(self, num_vars: int, clauses: Iterable[Tuple[int, int]] = ()):
+        self.num_vars = num_vars
+        self.sources = array('i')
+        self.targets = array('i')
+        self._graph: Optional[CSRGraph] = None
+        self._comp_id: Optional[array] = None
+        self.add_clauses(clauses)
+
+    def add_clauses(self, clauses: Iterable[Tuple[int, int]]) -> None:
+        """Add clauses, invalidating the cached SCCs only if a new edge crosses them backwards."""
+        start = len(self.sources)
+        _append_clause_edges(clauses, self.num_vars, self.sources, self.targets)
+        if start == len(self.sources):
+            return
+
+        self._graph = None
+        comp_id = self._comp_id
+        if comp_id is not None:
+            for pos in range(start, len(self.sources)):
+                if comp_id[self.sources[pos]] < comp_id[self.targets[pos]]:
+                    self._comp_id = None
+                    break
 
-    while stack:
-        node = stack.pop()
-        if node not in visited:
-            component: List[int] = []
-            dfs_second(node, visited, component, reversed_graph)
-            sccs.append(component)
+    @property
+    def graph(self) -> CSRGraph:
+        """The implication graph in CSR form, rebuilt only after new clauses arrive."""
+        if self._graph is None:
+            self._graph = _edges_to_csr(self.sources, self.targets, 2 * self.num_vars)
+        return self._graph
 
-    return sccs
+    def solve(self) -> Optional[List[bool]]:
+        """Return a satisfying assignment (as two_sat_solver does), reusing cached SCCs."""
+        if self._comp_id is None:
+            self._comp_id = tarjan_scc(self.graph)
+        return _read_assignment(self._comp_id, self.num_vars)
 
 # Example usage
 if __name__ == "__main__":
@@ -185,10 +428,10 @@ if __name__ == "__main__":
     ]
     num_vars1 = 3
     
-    result1 = two_sat_solver(clauses1, num_vars1)
-    print(f"Result: {'Satisfiable ✓' if result1 else 'Unsatisfiable ✗'}")
-    if result1:
-        print("One valid assignment: x1=False, x2=True, x3=False")
+    result1 = two_sat_solver(num_vars1, clauses1)
+    print(f"Result: {'Satisfiable ✓' if result1 is not None else 'Unsatisfiable ✗'}")
+    if result1 is not None:
+        print("One valid assignment:", ", ".join(f"x{i + 1}={value}" for i, value in enumerate(result1)))
     
     # Example 2: Unsatisfiable formula
     print("\n" + "=" * 60)
@@ -202,9 +445,9 @@ if __name__ == "__main__":
     ]
     num_vars2 = 2
     
-    result2 = two_sat_solver(clauses2, num_vars2)
-    print(f"Result: {'Satisfiable ✓' if result2 else 'Unsatisfiable ✗'}")
-    if not result2:
+    result2 = two_sat_solver(num_vars2, clauses2)
+    print(f"Result: {'Satisfiable ✓' if result2 is not None else 'Unsatisfiable ✗'}")
+    if result2 is None:
         print("Explanation: These clauses force contradictory requirements")
         print("  x1=True requires x2=True AND x2=False (impossible!)")
         print("  x1=False requires x2=True AND x2=False (impossible!)")
@@ -219,7 +462,8 @@ if __name__ == "__main__":
     ]
     num_vars3 = 2
     
-    result3 = two_sat_solver(clauses3, num_vars3)
-    print(f"Result: {'Satisfiable ✓' if result3 else 'Unsatisfiable ✗'}")
-    if result3:
-        print("Valid assignments: x1=True, x2=False OR x1=False, x2=True")
\ No newline at end of file
+    result3 = two_sat_solver(num_vars3, clauses3)
+    print(f"Result: {'Satisfiable ✓' if result3 is not None else 'Unsatisfiable ✗'}")
+    if result3 is not None:
+        print("Valid assignments: x1=True, x2=False OR x1=False, x2=True")
+        print("Found:", ", ".join(f"x{i + 1}={value}" for i, value in enumerate(result3)))
\ No newline at end of file
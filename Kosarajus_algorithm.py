@@ -11,13 +11,14 @@ Kosaraju's algorithm finds all SCCs in O(V + E) time using two DFS passes:
 3. Second DFS: Process vertices in decreasing finish time order
 
 Time Complexity: O(V + E)
-Space Complexity: O(V)
+Space Complexity: O(V + E)
 
 Functions:
 - kosaraju_scc(graph: Dict[int, List[int]]) -> List[List[int]]:
     Finds all strongly connected components in a directed graph.
 """
-from typing import Dict, List, Set
+from array import array
+from typing import Dict, List, Tuple
 
 
 def kosaraju_scc(graph: Dict[int, List[int]]) -> List[List[int]]:
@@ -28,6 +29,11 @@ def kosaraju_scc(graph: Dict[int, List[int]]) -> List[List[int]]:
     1. Perform DFS on original graph to get finish times
     2. Reverse the graph edges
     3. Perform DFS on reversed graph in decreasing finish time order
+
+    Node labels are compacted to 0..V-1 once, and both the graph and its
+    reverse are stored in CSR form (neighbours of u are
+    indices[indptr[u]:indptr[u + 1]]), so the DFS passes index flat arrays
+    instead of hashing labels.
     
     Args:
         graph: Adjacency list representing the directed graph
@@ -36,56 +42,116 @@ def kosaraju_scc(graph: Dict[int, List[int]]) -> List[List[int]]:
         List of SCCs, where each SCC is a list of node IDs
         
     Time Complexity: O(V + E)
-    Space Complexity: O(V)
+    Space Complexity: O(V + E)
     """
-    def dfs_first_pass(node: int, visited: Set[int], stack: List[int]) -> None:
-        """First DFS to record finish times (post-order)."""
-        visited.add(node)
-        for neighbor in graph.get(node, []):
-            if neighbor not in visited:
-                dfs_first_pass(neighbor, visited, stack)
-        stack.append(node)  # Post-order: add after exploring all neighbors
-
-    def dfs_second_pass(node: int, visited: Set[int], component: List[int], 
-                       reversed_graph: Dict[int, List[int]]) -> None:
-        """Second DFS to collect nodes in current SCC."""
-        visited.add(node)
-        component.append(node)
-        for neighbor in reversed_graph.get(node, []):
-            if neighbor not in visited:
-                dfs_second_pass(neighbor, visited, component, reversed_graph)
-
-    def reverse_graph(g: Dict[int, List[int]]) -> Dict[int, List[int]]:
-        """Create a graph with all edges reversed."""
-        reversed_g: Dict[int, List[int]] = {node: [] for node in g}
-        for node in g:
-            for neighbor in g[node]:
-                if neighbor not in reversed_g:
-                    reversed_g[neighbor] = []
-                reversed_g[neighbor].append(node)
-        return reversed_g
+    def dfs_first_pass(root: int, visited: bytearray, fs_top: int) -> int:
+        """First DFS to record finish times (post-order); returns the new finish-stack top."""
+        visited[root] = 1
+        work_v[0] = root
+        work_pos[0] = indptr[root]
+        top = 0
+        while top >= 0:
+            node = work_v[top]
+            pos = work_pos[top]
+            if pos == indptr[node + 1]:
+                top -= 1
+                finish_stack[fs_top] = node  # Post-order: add after exploring all neighbors
+                fs_top += 1
+                continue
+            work_pos[top] = pos + 1
+            neighbor = indices[pos]
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                top += 1
+                work_v[top] = neighbor
+                work_pos[top] = indptr[neighbor]
+        return fs_top
+
+    def dfs_second_pass(root: int, visited: bytearray, members_top: int,
+                       rev_indptr: array, rev_indices: array) -> int:
+        """Second DFS appending the current SCC to members; returns the new members top."""
+        visited[root] = 1
+        members[members_top] = root
+        members_top += 1
+        work_v[0] = root
+        top = 0
+        while top >= 0:
+            node = work_v[top]
+            top -= 1
+            for pos in range(rev_indptr[node], rev_indptr[node + 1]):
+                neighbor = rev_indices[pos]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    members[members_top] = neighbor
+                    members_top += 1
+                    top += 1
+                    work_v[top] = neighbor
+        return members_top
+
+    def reverse_graph(fwd_indptr: array, fwd_indices: array) -> Tuple[array, array]:
+        """Create the CSR graph with all edges reversed via a counting sort on targets."""
+        rev_indptr = array('i', bytes(4 * (n + 1)))
+        for v in fwd_indices:
+            rev_indptr[v + 1] += 1
+        for u in range(n):
+            rev_indptr[u + 1] += rev_indptr[u]
+        rev_indices = array('i', bytes(4 * len(fwd_indices)))
+        position = rev_indptr[:n]
+        for u in range(n):
+            for pos in range(fwd_indptr[u], fwd_indptr[u + 1]):
+                v = fwd_indices[pos]
+                rev_indices[position[v]] = u
+                position[v] += 1
+        return rev_indptr, rev_indices
+
+    # Compact node labels to 0..n-1 (nodes that only appear as neighbours included)
+    labels: List[int] = list(graph)
+    index_of: Dict[int, int] = {node: i for i, node in enumerate(labels)}
+    for neighbors in graph.values():
+        for neighbor in neighbors:
+            if neighbor not in index_of:
+                index_of[neighbor] = len(labels)
+                labels.append(neighbor)
+    n = len(labels)
+
+    # Forward graph in CSR form
+    indptr = array('i', bytes(4 * (n + 1)))
+    indices = array('i')
+    for u, node in enumerate(labels):
+        neighbors = graph.get(node, ())
+        indices.extend(index_of[neighbor] for neighbor in neighbors)
+        indptr[u + 1] = len(indices)
+
+    # DFS stacks, the finish stack and the SCC member buffer are all
+    # preallocated int arrays addressed by explicit top pointers
+    work_v = array('i', bytes(4 * n))
+    work_pos = array('i', bytes(4 * n))
+    finish_stack = array('i', bytes(4 * n))
+    members = array('i', bytes(4 * n))
 
     # Step 1: First DFS to get finish times
-    visited: Set[int] = set()
-    finish_stack: List[int] = []
+    visited = bytearray(n)
+    fs_top = 0
     
-    for node in graph:
-        if node not in visited:
-            dfs_first_pass(node, visited, finish_stack)
+    for node in range(n):
+        if not visited[node]:
+            fs_top = dfs_first_pass(node, visited, fs_top)
 
     # Step 2: Reverse the graph
-    reversed_graph = reverse_graph(graph)
+    rev_indptr, rev_indices = reverse_graph(indptr, indices)
     
-    # Step 3: Second DFS in reverse finish order
+    # Step 3: Second DFS in reverse finish order; each SCC is a slice of members
     sccs: List[List[int]] = []
-    visited.clear()
-
-    while finish_stack:
-        node = finish_stack.pop()  # Process in decreasing finish time
-        if node not in visited:
-            component: List[int] = []
-            dfs_second_pass(node, visited, component, reversed_graph)
-            sccs.append(component)
+    visited = bytearray(n)
+    members_top = 0
+
+    while fs_top:
+        fs_top -= 1
+        node = finish_stack[fs_top]  # Process in decreasing finish time
+        if not visited[node]:
+            start = members_top
+            members_top = dfs_second_pass(node, visited, members_top, rev_indptr, rev_indices)
+            sccs.append([labels[member] for member in members[start:members_top]])
 
     return sccs     
 
@@ -4,8 +4,8 @@ Specialized in spatial indexing and efficient querying of geographical datasets
 
 """
 
-from typing import List, Tuple
-from sklearn.neighbors import KDTree
+from typing import List, Tuple, Union
+from scipy.spatial import cKDTree
 from sklearn.cluster import DBSCAN
 import numpy as np
 
@@ -13,71 +13,92 @@ import numpy as np
 Spatial Analyzer for Geographical Data
 functions:
 - spatial_index(data: List[tuple]) -> None
-- range_query(spatial_bounds: tuple) -> List[tuple]
-- nearest_neighbors(point: tuple, k: int) -> List[tuple]
-- spatial_clustering(eps: float, min_samples: int) -> List[List[tuple]]
+- range_query(spatial_bounds: tuple) -> np.ndarray
+- nearest_neighbors(points: tuple or (M, 2) array, k: int) -> np.ndarray
+- spatial_clustering(eps: float, min_samples: int, n_jobs: int = -1) -> List[np.ndarray]
 - spatial_index: Builds a spatial index for efficient querying.
 
 range_query: Returns all spatial data points within the specified spatial bounds.
-nearest_neighbors: Finds the k nearest neighbors of a given point.
+nearest_neighbors: Finds the k nearest neighbors of a given point (or batch of points).
 spatial_clustering: Performs spatial clustering using DBSCAN algorithm.
 spatial_index: Builds a spatial index for efficient querying.
 
 """
 class SpatialAnalyzer:
     def __init__(self):
-        self.data = []
+        # Points live in one contiguous (N, 2) float32 array; column 0 is x, column 1 is y
+        self.points = np.empty((0, 2), dtype=np.float32)
         self.kd_tree = None
+        self._x_order = np.empty(0, dtype=np.intp)
+        self._sorted_x = np.empty(0, dtype=np.float32)
 
     def spatial_index(self, data: List[Tuple[float, float]]):
         """Build a spatial index for efficient querying."""
-        self.data = data
-        self.kd_tree = KDTree(np.array(data))
+        self.points = np.ascontiguousarray(data, dtype=np.float32).reshape(-1, 2)
+        self.kd_tree = cKDTree(self.points, leafsize=32, balanced_tree=True, compact_nodes=True)
+        # Points sorted by x, so rectangle queries can binary-search the x range
+        self._x_order = np.argsort(self.points[:, 0], kind='stable')
+        self._sorted_x = self.points[self._x_order, 0]
 
-    def range_query(self, spatial_bounds: Tuple[float, float, float, float]) -> List[Tuple[float, float]]:
-        """Return all spatial data points within the specified spatial bounds."""
-        if not self.kd_tree:
-            return []
+    def range_query(self, spatial_bounds: Tuple[float, float, float, float]) -> np.ndarray:
+        """Return all spatial data points within the specified spatial bounds as an (M, 2) array."""
+        if self.kd_tree is None:
+            return np.empty((0, 2), dtype=np.float32)
         
         x_min, y_min, x_max, y_max = spatial_bounds
-        indices = self.kd_tree.query_radius(
-            np.array([[ (x_min + x_max) / 2, (y_min + y_max) / 2 ]]),
-            r=max(x_max - x_min, y_max - y_min) / 2
-        )[0]
-        
-        result = []
-        for idx in indices:
-            point = self.data[idx]
-            if x_min <= point[0] <= x_max and y_min <= point[1] <= y_max:
-                result.append(point)
+        # O(log N) slice of the points whose x lies in [x_min, x_max] ...
+        lo = np.searchsorted(self._sorted_x, x_min, side='left')
+        hi = np.searchsorted(self._sorted_x, x_max, side='right')
+        candidates = self._x_order[lo:hi]
+        # ... then one vectorized mask on y over that slice only
+        ys = self.points[candidates, 1]
+        hits = np.sort(candidates[(ys >= y_min) & (ys <= y_max)])
         
-        return result
+        return self.points[hits]
 
-    def nearest_neighbors(self, point: Tuple[float, float], k: int) -> List[Tuple[float, float]]:
-        """Find the k nearest neighbors of a given point."""
-        if not self.kd_tree:
-            return []
+    def nearest_neighbors(self, points: Union[Tuple[float, float], np.ndarray], k: int) -> np.ndarray:
+        """
+        Find the k nearest neighbors of one point or of a batch of points.
+
+        A single (x, y) point returns a (k, 2) array; an (M, 2) batch returns
+        an (M, k, 2) array and is searched in parallel across all cores.
+        """
+        queries = np.asarray(points, dtype=np.float32)
+        if self.kd_tree is None:
+            return np.empty((0, 2) if queries.ndim == 1 else (len(queries), 0, 2), dtype=np.float32)
         
-        distances, indices = self.kd_tree.query([point], k=k)
-        return [self.data[idx] for idx in indices[0]]
+        k = min(k, len(self.points))
+        batch = np.atleast_2d(queries)
+        distances, indices = self.kd_tree.query(batch, k=k, workers=-1)
+        neighbors = self.points[np.reshape(indices, (len(batch), k))]
+        return neighbors[0] if queries.ndim == 1 else neighbors
+
+    def spatial_clustering(self, eps: float, min_samples: int, n_jobs: int = -1) -> List[np.ndarray]:
+        """
+        Perform spatial clustering using DBSCAN algorithm; each cluster is an (M, 2) array.
 
-    def spatial_clustering(self, eps: float, min_samples: int) -> List[List[Tuple[float, float]]]:
-        """Perform spatial clustering using DBSCAN algorithm."""
-        if not self.data:
+        Neighbourhoods are found with a ball tree instead of brute force, and
+        n_jobs (default -1: all cores) is passed through to DBSCAN.
+        """
+        if len(self.points) == 0:
             return []
         
-        db = DBSCAN(eps=eps, min_samples=min_samples).fit(np.array(self.data))
+        db = DBSCAN(eps=eps, min_samples=min_samples, algorithm='ball_tree',
+                    leaf_size=40, n_jobs=n_jobs).fit(self.points)
         labels = db.labels_
         
-        clusters = {}
-        for idx, label in enumerate(labels):
-            if label == -1:
-                continue  # Noise
-            if label not in clusters:
-                clusters[label] = []
-            clusters[label].append(self.data[idx])
+        # Group by label without a per-point loop: stable sort by label, drop
+        # noise (-1), then split wherever the label changes
+        order = np.argsort(labels, kind='stable')
+        sorted_labels = labels[order]
+        keep = sorted_labels >= 0
+        order = order[keep]
+        sorted_labels = sorted_labels[keep]
+        if order.size == 0:
+            return []
         
-        return list(clusters.values())
+        boundaries = np.flatnonzero(np.diff(sorted_labels)) + 1
+        return np.split(self.points[order], boundaries)
     
 # Example usage:
 if __name__ == "__main__":
@@ -11,11 +11,16 @@ Algorithm:
 2. Relax all edges V-1 times (where V = number of vertices)
 3. Check for negative cycles by trying one more relaxation
 
+This implementation uses the queue-based formulation (SPFA with the
+Smallest-Label-First heuristic): instead of sweeping every edge V-1 times it
+only relaxes edges leaving vertices whose distance just improved, and flags a
+negative cycle once some shortest path would need V or more edges.
+
 Key Properties:
 - Can handle negative edge weights
 - Detects negative cycles
-- Time Complexity: O(V × E)
-- Space Complexity: O(V)
+- Time Complexity: O(V × E) worst case
+- Space Complexity: O(V + E)
 
 Why V-1 iterations?
 In a graph with V vertices, any shortest path can have at most V-1 edges
@@ -23,12 +28,160 @@ In a graph with V vertices, any shortest path can have at most V-1 edges
 one more edge.
 """
 
-from typing import Dict, List, Tuple, Set
+from array import array
+from collections import deque
+from typing import Dict, List, Optional, Tuple, Union
+
+# "Infinity" for integer distances: far below the int64 limit so that adding
+# a weight to a real distance can never wrap around
+INT_INF = (2 ** 63 - 1) // 4
+
+
+def _to_csr(graph: Dict[int, List[Tuple[int, float]]],
+            weight_type: Optional[str] = 'd') -> Tuple[List[int], Dict[int, int], array, array, array]:
+    """
+    Flatten an adjacency dict into CSR arrays over compact vertex ids.
+
+    Returns (labels, index_of, indptr, targets, weights): labels[i] is the
+    original node for id i, and the edges leaving id u are
+    targets/weights[indptr[u]:indptr[u + 1]]. Vertices that only appear as
+    neighbours get ids after the graph's keys and have no outgoing edges.
+    weight_type is the array typecode for weights ('d' float64, 'q' int64),
+    or None for a plain list of Python numbers (exact ints of any size).
+    """
+    labels: List[int] = list(graph)
+    index_of: Dict[int, int] = {node: i for i, node in enumerate(labels)}
+    indptr = array('i', [0])
+    targets = array('i')
+    weights = array(weight_type) if weight_type else []
+    for neighbors in graph.values():
+        for v, weight in neighbors:
+            v_index = index_of.get(v)
+            if v_index is None:
+                v_index = index_of[v] = len(labels)
+                labels.append(v)
+            targets.append(v_index)
+            weights.append(weight)
+        indptr.append(len(targets))
+    indptr.extend([len(targets)] * (len(labels) - len(graph)))
+    return labels, index_of, indptr, targets, weights
+
+
+def _bellman_ford_kernel(indptr: array, targets: array, weights: array,
+                         distances: array, source: int) -> Tuple[int, int]:
+    """
+    Queue-based (SPFA/SLF) relaxation over CSR arrays, updating distances in place.
+
+    Works purely on numbers and flat arrays (float64 or int64 alike: only
+    vertices with a finite distance are ever queued, so "infinity" is never
+    added to) and reports a negative cycle through
+    its return value rather than raising: (-1, -1) on success, otherwise the
+    (vertex id, edge position) of the relaxation that proved the cycle.
+    """
+    num_vertices = len(distances)
+    # hops[v] = number of edges on the current best path to v; a simple path
+    # has at most V-1 edges, so reaching V proves a negative cycle
+    hops = array('i', bytes(4 * num_vertices))
+    in_queue = bytearray(num_vertices)
+    queue = deque([source])
+    in_queue[source] = 1
+
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = 0
+        du = distances[u]
+        for pos in range(indptr[u], indptr[u + 1]):
+            v = targets[pos]
+            new_distance = du + weights[pos]
+            if new_distance < distances[v]:
+                distances[v] = new_distance
+                hops[v] = hops[u] + 1
+                if hops[v] >= num_vertices:
+                    return u, pos
+                if not in_queue[v]:
+                    in_queue[v] = 1
+                    # SLF: smaller tentative distances are processed first
+                    if queue and new_distance < distances[queue[0]]:
+                        queue.appendleft(v)
+                    else:
+                        queue.append(v)
+
+    return -1, -1
+
+
+def _fits_int64(graph: Dict[int, List[Tuple[int, float]]]) -> bool:
+    """
+    Return True if every edge weight is a Python int and int64 arithmetic is safe.
+
+    A distance is the sum of at most V-1 edge weights, so the int64 path is
+    exact only when max|w| * (V-1) < INT_INF; larger real distances would be
+    mistaken for the "unreachable" sentinel (or not fit in int64 at all).
+    V <= len(graph) + E, since every vertex is a key or some edge's target.
+    """
+    max_weight = 0
+    num_edges = 0
+    for neighbors in graph.values():
+        for _, weight in neighbors:
+            if type(weight) is not int:
+                return False
+            if abs(weight) > max_weight:
+                max_weight = abs(weight)
+        num_edges += len(neighbors)
+    return max_weight * (len(graph) + num_edges - 1) < INT_INF
+
+
+def _run_from(csr: Tuple[List[int], Dict[int, int], array, array, array], start_node: int,
+              weight_type: Optional[str], infinity: Union[int, float]) -> array:
+    """Run the kernel from start_node over prebuilt CSR arrays and raise on negative cycles."""
+    labels, index_of, indptr, targets, weights = csr
+    source = index_of[start_node]
+
+    # Initialize distances
+    if weight_type:
+        distances = array(weight_type, [infinity]) * len(labels)
+    else:
+        distances = [infinity] * len(labels)
+    distances[source] = 0
+
+    u, pos = _bellman_ford_kernel(indptr, targets, weights, distances, source)
+    if u != -1:
+        raise ValueError(
+            f"Graph contains a negative cycle reachable from node {start_node}. "
+            f"Cycle involves edge ({labels[u]}, {labels[targets[pos]]}) with weight {weights[pos]}"
+        )
+    
+    return distances
+
+
+def _as_float_dict(labels: List[int], distances: array, weight_type: str) -> Dict[int, float]:
+    """Map a distance array back to {node: float distance}, translating INT_INF to inf."""
+    if weight_type == 'q':
+        inf = float('inf')
+        return {labels[i]: float(d) if d != INT_INF else inf for i, d in enumerate(distances)}
+    return {labels[i]: distances[i] for i in range(len(labels))}
+
+
+def _shortest_paths(graph: Dict[int, List[Tuple[int, float]]], start_node: int,
+                    weight_type: Optional[str], infinity: Union[int, float]) -> Tuple[List[int], array]:
+    """Build CSR arrays of the given weight type and run a single-source search."""
+    if start_node not in graph:
+        raise KeyError(f"Start node {start_node} not in graph")
+    
+    csr = _to_csr(graph, weight_type)
+    return csr[0], _run_from(csr, start_node, weight_type, infinity)
 
 
 def bellman_ford(graph: Dict[int, List[Tuple[int, float]]], start_node: int) -> Dict[int, float]:
     """
     Perform Bellman-Ford algorithm to find shortest paths from start_node.
+
+    The graph is flattened once into CSR arrays (offsets, targets, weights)
+    over compact vertex ids 0..V-1. Relaxation is queue-driven: only vertices
+    whose distance just decreased have their outgoing edges relaxed, and a
+    vertex whose new distance beats the current queue front is pushed to the
+    front (Smallest-Label-First). When every weight is an int the relaxation
+    runs on int64 arrays (see bellman_ford_int) and is converted back to
+    floats at the end.
     
     Args:
         graph: Adjacency list with edge weights. Format: {node: [(neighbor, weight), ...]}
@@ -38,62 +191,93 @@ def bellman_ford(graph: Dict[int, List[Tuple[int, float]]], start_node: int) ->
         Dictionary mapping each vertex to its shortest distance from start_node
         
     Raises:
-        ValueError: If the graph contains a negative weight cycle reachable from start_node
+        ValueError: If the graph contains a negative cycle reachable from start_node
         KeyError: If start_node is not in the graph
         
-    Time Complexity: O(V × E) where V = vertices, E = edges
-    Space Complexity: O(V)
+    Time Complexity: O(V × E) worst case, typically close to O(E)
+    Space Complexity: O(V + E)
     
     Example:
         >>> graph = {0: [(1, 4)], 1: [(2, -2)], 2: []}
         >>> bellman_ford(graph, 0)
         {0: 0.0, 1: 4.0, 2: 2.0}
     """
-    if start_node not in graph:
-        raise KeyError(f"Start node {start_node} not in graph")
-    
-    # Collect all vertices (including those only appearing as neighbors)
-    vertices: Set[int] = set(graph.keys())
-    for neighbors in graph.values():
-        for neighbor, _ in neighbors:
-            vertices.add(neighbor)
-    
-    # Initialize distances
-    distances: Dict[int, float] = {v: float('inf') for v in vertices}
-    distances[start_node] = 0.0
-    
-    num_vertices = len(vertices)
+    if _fits_int64(graph):
+        labels, distances = _shortest_paths(graph, start_node, 'q', INT_INF)
+        return _as_float_dict(labels, distances, 'q')
+
+    labels, distances = _shortest_paths(graph, start_node, 'd', float('inf'))
+    return _as_float_dict(labels, distances, 'd')
+
+
+def bellman_ford_int(graph: Dict[int, List[Tuple[int, int]]], start_node: int) -> Dict[int, Union[int, float]]:
+    """
+    Bellman-Ford specialised for integer edge weights.
+
+    Distances are kept in an int64 array with INT_INF as the "unreachable"
+    sentinel, so relaxation is pure integer arithmetic with no float
+    conversion or inf handling. Weights too large for that (see _fits_int64)
+    are relaxed as exact Python ints in plain lists instead.
     
-    # Relax all edges V-1 times
-    for iteration in range(num_vertices - 1):
-        updated = False
-        for u in graph:
-            if distances[u] == float('inf'):
-                continue  # Skip unreachable vertices
-                
-            for v, weight in graph[u]:
-                new_distance = distances[u] + weight
-                if new_distance < distances[v]:
-                    distances[v] = new_distance
-                    updated = True
+    Args:
+        graph: Adjacency list with integer edge weights
+        start_node: The source vertex
         
-        # Early termination if no updates in this iteration
-        if not updated:
-            break
-    
-    # Check for negative weight cycles
-    for u in graph:
-        if distances[u] == float('inf'):
-            continue
-            
-        for v, weight in graph[u]:
-            if distances[u] + weight < distances[v]:
-                raise ValueError(
-                    f"Graph contains a negative weight cycle reachable from node {start_node}. "
-                    f"Cycle involves edge ({u}, {v}) with weight {weight}"
-                )
+    Returns:
+        Dictionary mapping each vertex to its exact integer distance, or
+        float('inf') if it is unreachable from start_node
+        
+    Raises:
+        ValueError: If the graph contains a negative cycle reachable from start_node
+        KeyError: If start_node is not in the graph
+        TypeError: If some weight is not an integer
+    """
+    inf = float('inf')
+    if not _fits_int64(graph):
+        for neighbors in graph.values():
+            for _, weight in neighbors:
+                if type(weight) is not int:
+                    raise TypeError(f"Edge weight {weight!r} is not an integer")
+        labels, distances = _shortest_paths(graph, start_node, None, inf)
+        return dict(zip(labels, distances))
+    labels, distances = _shortest_paths(graph, start_node, 'q', INT_INF)
+    return {labels[i]: d if d != INT_INF else inf for i, d in enumerate(distances)}
+
+def bellman_ford_multi(graph: Dict[int, List[Tuple[int, float]]],
+                       sources: List[int]) -> Dict[int, Dict[int, float]]:
+    """
+    Run Bellman-Ford from several sources over one shared graph flattening.
+
+    The adjacency dict is converted to CSR arrays (and checked for integer
+    weights) once; each source then only pays for its own relaxation.
     
-    return distances
+    Args:
+        graph: Adjacency list with edge weights
+        sources: Source vertices to solve from
+        
+    Returns:
+        Dictionary mapping each source to its {vertex: distance} dictionary
+        (the same shape bellman_ford returns)
+        
+    Raises:
+        ValueError: If a negative cycle is reachable from any of the sources
+        KeyError: If some source is not in the graph
+    """
+    for start_node in sources:
+        if start_node not in graph:
+            raise KeyError(f"Start node {start_node} not in graph")
+
+    if _fits_int64(graph):
+        weight_type, infinity = 'q', INT_INF
+    else:
+        weight_type, infinity = 'd', float('inf')
+
+    csr = _to_csr(graph, weight_type)
+    labels = csr[0]
+    return {
+        start_node: _as_float_dict(labels, _run_from(csr, start_node, weight_type, infinity), weight_type)
+        for start_node in sources
+    }
 
 # Example usage
 if __name__ == "__main__":
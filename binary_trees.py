@@ -34,6 +34,9 @@ are different.
 """
 
 class BinaryTreeNode:
+    # Fixed attribute set: no per-node __dict__
+    __slots__ = ('value', 'left', 'right')
+
     def __init__(self, value):
         self.value = value
         self.left = None
@@ -43,43 +46,84 @@ def build_tree_from_pre_in(preorder, inorder):
     if not preorder or not inorder:
         return None
     
-    root_value = preorder[0]
-    root = BinaryTreeNode(root_value)
-    
-    root_index_in_inorder = inorder.index(root_value)
-    
-    root.left = build_tree_from_pre_in(
-        preorder[1:1 + root_index_in_inorder],
-        inorder[:root_index_in_inorder]
-    )
-    
-    root.right = build_tree_from_pre_in(
-        preorder[1 + root_index_in_inorder:],
-        inorder[root_index_in_inorder + 1:]
-    )
-    
-    return root
+    # Position of every value in the in-order sequence, looked up in O(1)
+    inorder_index = {value: i for i, value in enumerate(inorder)}
+
+    def build(pre_lo, in_lo, in_hi):
+        # Subtree whose pre-order starts at pre_lo and in-order is inorder[in_lo:in_hi]
+        if in_lo >= in_hi:
+            return None
+        
+        root_value = preorder[pre_lo]
+        root = BinaryTreeNode(root_value)
+        
+        root_index_in_inorder = inorder_index[root_value]
+        left_size = root_index_in_inorder - in_lo
+        
+        root.left = build(pre_lo + 1, in_lo, root_index_in_inorder)
+        root.right = build(pre_lo + 1 + left_size, root_index_in_inorder + 1, in_hi)
+        
+        return root
+
+    return build(0, 0, len(inorder))
 
 def build_tree_from_post_in(postorder, inorder):
     if not postorder or not inorder:
         return None
     
-    root_value = postorder[-1]
-    root = BinaryTreeNode(root_value)
-    
-    root_index_in_inorder = inorder.index(root_value)
-    
-    root.left = build_tree_from_post_in(
-        postorder[:root_index_in_inorder],
-        inorder[:root_index_in_inorder]
-    )
-    
-    root.right = build_tree_from_post_in(
-        postorder[root_index_in_inorder:-1],
-        inorder[root_index_in_inorder + 1:]
-    )
+    # Position of every value in the in-order sequence, looked up in O(1)
+    inorder_index = {value: i for i, value in enumerate(inorder)}
+
+    def build(post_hi, in_lo, in_hi):
+        # Subtree whose post-order ends just before post_hi and in-order is inorder[in_lo:in_hi]
+        if in_lo >= in_hi:
+            return None
+        
+        root_value = postorder[post_hi - 1]
+        root = BinaryTreeNode(root_value)
+        
+        root_index_in_inorder = inorder_index[root_value]
+        right_size = in_hi - root_index_in_inorder - 1
+        
+        root.left = build(post_hi - 1 - right_size, in_lo, root_index_in_inorder)
+        root.right = build(post_hi - 1, root_index_in_inorder + 1, in_hi)
+        
+        return root
+
+    return build(len(postorder), 0, len(inorder))
+
+def intern_subtrees(root):
+    # Hash-consing: afterwards structurally equal subtrees are one shared node.
+    # Children are canonicalised before their parent (iterative post-order), so
+    # a subtree is identified by its value and the ids of its canonical children.
+    # Trees rebuilt from traversals have distinct values and never share anything;
+    # this pays off for trees with repeated values, such as expression trees.
+    if root is None:
+        return None
     
-    return root
+    interned = {}   # (value, id(left), id(right)) -> canonical node
+    canonical = {}  # id(node) -> canonical node
+    stack = [(root, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if not children_done:
+            stack.append((node, True))
+            if node.right is not None:
+                stack.append((node.right, False))
+            if node.left is not None:
+                stack.append((node.left, False))
+            continue
+        
+        if node.left is not None:
+            node.left = canonical[id(node.left)]
+        if node.right is not None:
+            node.right = canonical[id(node.right)]
+        key = (node.value,
+               None if node.left is None else id(node.left),
+               None if node.right is None else id(node.right))
+        canonical[id(node)] = interned.setdefault(key, node)
+
+    return canonical[id(root)]
 
 #example usage:
 if __name__ == "__main__":
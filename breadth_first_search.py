@@ -5,8 +5,9 @@ It includes a function to perform BFS and an example usage of the function.
 """
 
 import time
+from array import array
 from collections import deque
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple
 
 """BFS function definition
 the breadth_first_search function performs a breadth-first traversal of a graph starting from a specified node.it uses a queue to explore all neighbors at the present depth prior to moving on to nodes at the next depth level.
@@ -15,16 +16,53 @@ it takes two parameters:
 - start_node: The node from which to start the BFS traversal.
 """
 
+def _dense_vertex_count(graph: Dict[int, List[int]], start_node: int) -> int:
+    """Return V if every vertex is an int in 0..V-1, or 0 if a set should track visits instead.
+    Labels that are not ints, negative ids, or ids far larger than the graph
+    (a bytearray would be mostly empty) all report 0.
+    param graph: Dict[int, List[int]]: The adjacency list of the graph.
+    param start_node: int: The node from which the traversal starts.
+    """
+    try:
+        neighbor_lists = [neighbors for neighbors in graph.values() if neighbors]
+        largest = max(start_node, max(graph, default=start_node),
+                      max(map(max, neighbor_lists), default=start_node))
+        smallest = min(start_node, min(graph, default=start_node),
+                       min(map(min, neighbor_lists), default=start_node))
+    except TypeError:  # Labels that cannot be ordered against each other
+        return 0
+    if type(largest) is not int or type(smallest) is not int or smallest < 0:
+        return 0
+    if largest >= 4 * (len(graph) + 1):
+        return 0
+    return largest + 1
+
 def breadth_first_search(graph: Dict[int, List[int]], start_node: int) -> List[int]:
     """Perform BFS and return the nodes in visitation order.
     Returns a list with the order nodes were visited. This is often more useful
     than a set when the traversal sequence matters.
+    When the vertices are the ints 0..V-1, visited is a bytearray indexed by
+    vertex id instead of a hashed set.
     param graph: Dict[int, List[int]]: The adjacency list of the graph.
     param start_node: int: The node from which to start the BFS traversal.
     """
-    visited: Set[int] = set()  # A set to keep track of visited nodes.
     order: List[int] = []      # A list to record the order of visited nodes.
     queue = deque([start_node])# Queue for BFS traversal.
+
+    num_vertices = _dense_vertex_count(graph, start_node)
+    if num_vertices:
+        seen = bytearray(num_vertices)  # seen[v] == 1 once v has been queued.
+        seen[start_node] = 1
+        while queue:
+            current_node = queue.popleft()
+            order.append(current_node)
+            for neighbor in graph.get(current_node, []):
+                if not seen[neighbor]:
+                    seen[neighbor] = 1
+                    queue.append(neighbor)
+        return order
+
+    visited: Set[int] = set()  # A set to keep track of visited nodes.
     visited.add(start_node)
 
     while queue:
@@ -36,6 +74,46 @@ def breadth_first_search(graph: Dict[int, List[int]], start_node: int) -> List[i
                 queue.append(neighbor)
     return order
 
+def build_csr(graph: Dict[int, List[int]]) -> Tuple[array, array]:
+    """Convert an adjacency list whose vertices are the ints 0..V-1 into CSR arrays.
+    The neighbors of vertex u are indices[indptr[u]:indptr[u + 1]], stored in one
+    contiguous int array instead of one Python list per vertex.
+    param graph: Dict[int, List[int]]: The adjacency list of the graph.
+    """
+    largest = max(max(graph, default=-1),
+                  max((neighbor for neighbors in graph.values() for neighbor in neighbors), default=-1))
+    num_vertices = largest + 1
+    indptr = array('i', bytes(4 * (num_vertices + 1)))
+    indices = array('i')
+    for node in range(num_vertices):
+        indices.extend(graph.get(node, []))
+        indptr[node + 1] = len(indices)
+    return indptr, indices
+
+def breadth_first_search_csr(indptr: array, indices: array, start_node: int) -> List[int]:
+    """Layer-synchronous BFS over CSR arrays; returns nodes in visitation order.
+    Each iteration expands the whole current frontier at once, reading every
+    neighbor list as one contiguous slice, with visited kept as a bytearray.
+    The visitation order is the same as breadth_first_search.
+    param indptr, indices: The graph in CSR form, as returned by build_csr.
+    param start_node: int: The node from which to start the BFS traversal.
+    """
+    visited = bytearray(len(indptr) - 1)
+    visited[start_node] = 1
+    order: List[int] = [start_node]
+    frontier: List[int] = [start_node]
+
+    while frontier:
+        next_frontier: List[int] = []
+        for node in frontier:
+            for neighbor in indices[indptr[node]:indptr[node + 1]]:
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    next_frontier.append(neighbor)
+        order.extend(next_frontier)
+        frontier = next_frontier
+    return order
+
 # Example usage
 if __name__ == "__main__":
     # Defining a sample graph using an adjacency list
@@ -3,28 +3,29 @@ Depth-First Search (DFS) Algorithm Implementation
 This module provides an implementation of the Depth-First Search (DFS) algorithm for traversing or searching tree or graph data structures.
 It includes a function to perform DFS and an example usage of the function.
 """
-import sys
 import time
 from typing import Dict, List, Set
 
-# Increasing recursion limit for deep graphs
-sys.setrecursionlimit(10**6)
-
 """
-the depth_first_search function performs a depth-first traversal of a graph starting from a specified node.it uses recursion to explore as far as possible along each branch before backtracking.
+the depth_first_search function performs a depth-first traversal of a graph starting from a specified node.it uses an explicit stack of (node, neighbor iterator) pairs to explore as far as possible along each branch before backtracking, so deep graphs never hit Python's recursion limit.
 it takes three parameters:
 - graph: A dictionary representing the adjacency list of the graph.
 - start_node: The node from which to start the DFS traversal.
-- visited: A set to keep track of visited nodes (used internally during recursion).
+- visited: A set of already visited nodes (optional; nodes reached by this traversal are added to it).
 """
 # DFS function definition
-def depth_first_search(graph: Dict[int, List[int]], start_node: int, visited: Set[int] = None) -> Set[int]:#param graph: Dict[int, List[int]]: The adjacency list of the graph., start_node: int: The node from which to start the DFS traversal., visited: Set[int]: A set to keep track of visited nodes (used internally during recursion).
+def depth_first_search(graph: Dict[int, List[int]], start_node: int, visited: Set[int] = None) -> Set[int]:#param graph: Dict[int, List[int]]: The adjacency list of the graph., start_node: int: The node from which to start the DFS traversal., visited: Set[int]: A set of already visited nodes.
     if visited is None:
         visited = set()
     visited.add(start_node)
-    for neighbor in graph.get(start_node, []):#the method retrieves the list of neighbors for the current start_node from the graph's adjacency list. If the start_node has no neighbors, it defaults to an empty list to avoid errors.
-        if neighbor not in visited:
-            depth_first_search(graph, neighbor, visited)
+    stack = [(start_node, iter(graph.get(start_node, [])))]#each entry holds a node and an iterator over its remaining neighbors, so backtracking resumes where it left off. If a node has no neighbors, it defaults to an empty list to avoid errors.
+    while stack:
+        neighbor = next(stack[-1][1], None)
+        if neighbor is None:#all neighbors of the node on top of the stack are explored: backtrack
+            stack.pop()
+        elif neighbor not in visited:
+            visited.add(neighbor)
+            stack.append((neighbor, iter(graph.get(neighbor, []))))
     return visited
 
 # Example usage
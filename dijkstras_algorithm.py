@@ -4,123 +4,387 @@ Dijkstra's Algorithm for Shortest Paths (Non-Negative Weights Only)
 """
 
 import heapq
-from typing import Dict, List, Tuple, Set
+from array import array
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple, Set
 
+__all__ = ['dijkstra', 'dijkstra_all_paths', 'dijkstra_with_path', 'reverse_adjacency', 'dijkstra_astar', 'dijkstra_csr', 'dijkstra_csr_packed']
 
-def dijkstra(graph: Dict[int, List[Tuple[int, float]]], start_node: int) -> Dict[int, float]:
+# Packed heap keys (dist * V + vertex) are kept within int64 range
+INT64_MAX = 2 ** 63 - 1
+
+
+def _to_csr(graph: Dict[int, List[Tuple[int, float]]],
+            weight_type: str = 'd') -> Tuple[List[int], Dict[int, int], array, array, array]:
     """
-    Perform Dijkstra's algorithm to find shortest paths from start_node.
+    Flatten an adjacency dict into CSR arrays over compact vertex ids.
 
+    Returns (labels, index_of, indptr, indices, weights); the edges leaving
+    id u are indices/weights[indptr[u]:indptr[u + 1]]. Negative weights are
+    rejected during the same pass. weight_type is the array typecode for
+    weights ('d' float64, 'q' int64).
     """
-    if start_node not in graph:
-        raise KeyError(f"Start node {start_node} not in graph")
-    
-    # Collect all vertices
-    vertices: Set[int] = set(graph.keys())
+    labels: List[int] = list(graph)
+    index_of: Dict[int, int] = {node: i for i, node in enumerate(labels)}
+    indptr = array('i', [0])
+    indices = array('i')
+    weights = array(weight_type)
     for neighbors in graph.values():
-        for neighbor, weight in neighbors:
+        for v, weight in neighbors:
             if weight < 0:
                 raise ValueError(
                     f"Dijkstra's algorithm cannot handle negative weights. "
                     f"Found edge with weight {weight}. Use Bellman-Ford instead."
                 )
-            vertices.add(neighbor)
-    
-    # Initialize distances
-    distances: Dict[int, float] = {v: float('inf') for v in vertices}
-    distances[start_node] = 0.0
+            v_index = index_of.get(v)
+            if v_index is None:
+                v_index = index_of[v] = len(labels)
+                labels.append(v)
+            indices.append(v_index)
+            weights.append(weight)
+        indptr.append(len(indices))
+    indptr.extend([len(indices)] * (len(labels) - len(graph)))
+    return labels, index_of, indptr, indices, weights
+
+
+def dijkstra_csr(indptr: array, indices: array, weights: array, start: int, n: int,
+                 pred: Optional[array] = None) -> array:
+    """
+    Dijkstra over CSR arrays with a hand-rolled binary heap.
+
+    The heap is a pair of parallel arrays (heap_d, heap_v) sized for the
+    worst case: every edge is scanned once, so there are at most E + 1
+    pushes. If pred is given (an int array of length n), pred[v] is set to
+    the vertex id preceding v on its shortest path.
     
-    # Priority queue: (distance, vertex)
-    pq: List[Tuple[float, int]] = [(0.0, start_node)]
-    visited: Set[int] = set()
+    Returns:
+        float64 array of distances indexed by vertex id (inf if unreachable)
+    """
+    dist = array('d', [float('inf')]) * n
+    dist[start] = 0.0
+    done = bytearray(n)
+    capacity = len(indices) + 1
+    heap_d = array('d', bytes(8 * capacity))
+    heap_v = array('i', bytes(4 * capacity))
+    heap_d[0] = 0.0
+    heap_v[0] = start
+    size = 1
+
+    while size:
+        # Pop the root, then sift the last entry down from the top
+        du = heap_d[0]
+        u = heap_v[0]
+        size -= 1
+        if size:
+            d = heap_d[size]
+            v = heap_v[size]
+            i = 0
+            child = 1
+            while child < size:
+                if child + 1 < size and heap_d[child + 1] < heap_d[child]:
+                    child += 1
+                if heap_d[child] >= d:
+                    break
+                heap_d[i] = heap_d[child]
+                heap_v[i] = heap_v[child]
+                i = child
+                child = 2 * i + 1
+            heap_d[i] = d
+            heap_v[i] = v
+
+        # Skip outdated entries
+        if done[u]:
+            continue
+        done[u] = 1
+
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            nd = du + weights[k]
+            if nd < dist[v]:
+                dist[v] = nd
+                if pred is not None:
+                    pred[v] = u
+                # Push (nd, v): sift up from the new leaf
+                i = size
+                size += 1
+                while i:
+                    parent = (i - 1) >> 1
+                    if heap_d[parent] <= nd:
+                        break
+                    heap_d[i] = heap_d[parent]
+                    heap_v[i] = heap_v[parent]
+                    i = parent
+                heap_d[i] = nd
+                heap_v[i] = v
+
+    return dist
+
+
+def dijkstra_csr_packed(indptr: array, indices: array, weights: array, start: int, n: int) -> array:
+    """
+    Dijkstra over CSR arrays with integer weights and packed heap keys.
+
+    Each heap entry is the single int dist * n + vertex, so pushes allocate
+    no tuples and heapq compares plain ints; ties go to the smaller vertex
+    id. The caller must ensure (max distance + 1) * n fits in int64.
     
+    Returns:
+        int64 array of distances indexed by vertex id (-1 if unreachable)
+    """
+    dist = array('q', [-1]) * n
+    dist[start] = 0
+    done = bytearray(n)
+    pq: List[int] = [start]
+
     while pq:
-        current_dist, u = heapq.heappop(pq)
+        du, u = divmod(heapq.heappop(pq), n)
         
-        # Skip if already processed
-        if u in visited:
+        # Skip outdated entries
+        if done[u]:
             continue
-        
-        visited.add(u)
-        
-        # Skip if this is an outdated entry
-        if current_dist > distances[u]:
-            continue
-        
-        # Relax all edges from u
-        for v, weight in graph.get(u, []):
-            new_distance = distances[u] + weight
-            
-            if new_distance < distances[v]:
-                distances[v] = new_distance
-                heapq.heappush(pq, (new_distance, v))
+        done[u] = 1
+
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            nd = du + weights[k]
+            if dist[v] < 0 or nd < dist[v]:
+                dist[v] = nd
+                heapq.heappush(pq, nd * n + v)
+
+    return dist
+
+
+def dijkstra(graph: Dict[int, List[Tuple[int, float]]], start_node: int) -> Dict[int, float]:
+    """
+    Perform Dijkstra's algorithm to find shortest paths from start_node.
+
+    The graph is flattened to CSR arrays once and the search itself runs in
+    dijkstra_csr. When every weight is an int and the packed keys fit in
+    int64, dijkstra_csr_packed is used instead.
+    """
+    if start_node not in graph:
+        raise KeyError(f"Start node {start_node} not in graph")
+    
+    if all(type(weight) is int for neighbors in graph.values() for _, weight in neighbors):
+        # No shortest path is longer than the sum of all |weight|, and there
+        # are at most len(graph) + E vertices; checked on the Python ints
+        # before anything is stored in int64. Using |weight| keeps a large
+        # negative weight from hiding a large positive one, so negatives
+        # still reach _to_csr and its ValueError
+        total = sum(abs(weight) for neighbors in graph.values() for _, weight in neighbors)
+        num_vertices = len(graph) + sum(map(len, graph.values()))
+        if (total + 1) * num_vertices <= INT64_MAX:
+            labels, index_of, indptr, indices, weights = _to_csr(graph, 'q')
+            n = len(labels)
+            distances = dijkstra_csr_packed(indptr, indices, weights, index_of[start_node], n)
+            inf = float('inf')
+            return {labels[i]: float(d) if d >= 0 else inf for i, d in enumerate(distances)}
+    
+    labels, index_of, indptr, indices, weights = _to_csr(graph)
+    distances = dijkstra_csr(indptr, indices, weights, index_of[start_node], len(labels))
+    return {labels[i]: distances[i] for i in range(len(labels))}
+
+
+def dijkstra_all_paths(graph: Dict[int, List[Tuple[int, float]]],
+                       start_node: int) -> Tuple[Dict[int, float], Dict[int, int]]:
+    """
+    Single-source Dijkstra that also returns the shortest-path tree.
+
+    One search yields (distances, predecessors): predecessors[v] is the vertex
+    before v on a shortest path from start_node, so the path to any target
+    can be read off without searching again.
+    """
+    if start_node not in graph:
+        raise KeyError(f"Start node {start_node} not in graph")
+    
+    labels, index_of, indptr, indices, weights = _to_csr(graph)
+    n = len(labels)
+    pred = array('i', [-1]) * n
+    distances = dijkstra_csr(indptr, indices, weights, index_of[start_node], n, pred)
+    return ({labels[i]: distances[i] for i in range(n)},
+            {labels[v]: labels[u] for v, u in enumerate(pred) if u >= 0})
+
+
+def _path_to(predecessors: Dict[int, int], start_node: int, node: int) -> List[int]:
+    """
+    Walk predecessors back from node to start_node and return the path in order.
+
+    The first walk only counts hops; the second fills a list of exactly that
+    size from the end, so there is no growing append and no reverse pass.
+    """
+    length = 1
+    current = node
+    while current != start_node:
+        current = predecessors[current]
+        length += 1
     
-    return distances
+    path = [start_node] * length
+    current = node
+    for i in range(length - 1, 0, -1):
+        path[i] = current
+        current = predecessors[current]
+    return path
+
+
+def reverse_adjacency(graph: Dict[int, List[Tuple[int, float]]]) -> Dict[int, List[Tuple[int, float]]]:
+    """
+    Build the reversed adjacency list, rejecting negative weights on the way.
+
+    Build it once per graph and pass it to every dijkstra_with_path query on
+    that graph; it must be rebuilt if the graph changes.
+    """
+    reverse: Dict[int, List[Tuple[int, float]]] = defaultdict(list)
+    for u, neighbors in graph.items():
+        for v, weight in neighbors:
+            if weight < 0:
+                raise ValueError(
+                    f"Dijkstra's algorithm cannot handle negative weights. "
+                    f"Found edge with weight {weight}. Use Bellman-Ford instead."
+                )
+            reverse[v].append((u, weight))
+    return dict(reverse)
 
 
 def dijkstra_with_path(graph: Dict[int, List[Tuple[int, float]]], 
                        start_node: int, 
-                       end_node: int) -> Tuple[float, List[int]]:
+                       end_node: int,
+                       reverse: Optional[Dict[int, List[Tuple[int, float]]]] = None) -> Tuple[float, List[int]]:
+    """
+    Shortest path from start_node to end_node.
 
+    With reverse (from reverse_adjacency(graph)), bidirectional Dijkstra is
+    used: a forward search from start_node and a backward search from
+    end_node over the reversed edges advance alternately, always expanding
+    the side with the smaller frontier. best is the shortest
+    start -> v -> end length seen so far; once the two frontier minima add
+    up to at least best, no shorter path can exist and the search stops.
+    Without it, a forward search that stops at end_node is used, so a single
+    query never pays for reversing the whole graph.
+    
+    Returns:
+        (distance, path), or (inf, []) if end_node is unreachable
+    """
+    if reverse is None:
+        return dijkstra_astar(graph, start_node, end_node)
     if start_node not in graph:
         raise KeyError(f"Start node {start_node} not in graph")
     
-    # Collect all vertices and validate weights
-    vertices: Set[int] = set(graph.keys())
-    for neighbors in graph.values():
-        for neighbor, weight in neighbors:
-            if weight < 0:
-                raise ValueError("Dijkstra's algorithm requires non-negative weights")
-            vertices.add(neighbor)
+    if start_node == end_node:
+        return (0.0, [start_node])
     
-    if end_node not in vertices:
-        return (float('inf'), [])
+    inf = float('inf')
+    dist_f: Dict[int, float] = {start_node: 0.0}
+    dist_b: Dict[int, float] = {end_node: 0.0}
+    pred_f: Dict[int, int] = {}  # previous vertex on the path from start_node
+    succ_b: Dict[int, int] = {}  # next vertex on the path to end_node
+    pq_f: List[Tuple[float, int]] = [(0.0, start_node)]
+    pq_b: List[Tuple[float, int]] = [(0.0, end_node)]
+    done_f: Set[int] = set()
+    done_b: Set[int] = set()
+    best = inf
+    meet: Optional[int] = None
     
-    # Initialize
-    distances: Dict[int, float] = {v: float('inf') for v in vertices}
-    distances[start_node] = 0.0
-    predecessors: Dict[int, int] = {}
+    while pq_f and pq_b:
+        if pq_f[0][0] + pq_b[0][0] >= best:
+            break
+        
+        if pq_f[0][0] <= pq_b[0][0]:
+            current_dist, u = heapq.heappop(pq_f)
+            if u in done_f:
+                continue
+            done_f.add(u)
+            for v, weight in graph.get(u, []):
+                new_distance = current_dist + weight
+                if new_distance < dist_f.get(v, inf):
+                    dist_f[v] = new_distance
+                    pred_f[v] = u
+                    heapq.heappush(pq_f, (new_distance, v))
+                    if v in dist_b and new_distance + dist_b[v] < best:
+                        best = new_distance + dist_b[v]
+                        meet = v
+        else:
+            current_dist, u = heapq.heappop(pq_b)
+            if u in done_b:
+                continue
+            done_b.add(u)
+            for v, weight in reverse.get(u, []):
+                new_distance = current_dist + weight
+                if new_distance < dist_b.get(v, inf):
+                    dist_b[v] = new_distance
+                    succ_b[v] = u
+                    heapq.heappush(pq_b, (new_distance, v))
+                    if v in dist_f and new_distance + dist_f[v] < best:
+                        best = new_distance + dist_f[v]
+                        meet = v
+    
+    if meet is None:
+        return (inf, [])
     
-    pq: List[Tuple[float, int]] = [(0.0, start_node)]
-    visited: Set[int] = set()
+    # Reconstruct path: start_node .. meet from the forward side, then
+    # meet .. end_node from the backward side
+    path = _path_to(pred_f, start_node, meet)
+    current = meet
+    while current != end_node:
+        current = succ_b[current]
+        path.append(current)
+    
+    return (best, path)
+
+
+def dijkstra_astar(graph: Dict[int, List[Tuple[int, float]]],
+                   start_node: int,
+                   end_node: int,
+                   heuristic: Optional[Callable[[int], float]] = None) -> Tuple[float, List[int]]:
+    """
+    Shortest path from start_node to end_node using A* search.
+
+    Vertices are popped in order of g + heuristic(v), where g is the best
+    known distance from start_node, so the search is pulled towards end_node
+    instead of expanding in all directions. The heuristic must be admissible
+    (never overestimate the remaining distance to end_node), otherwise the
+    returned path may not be the shortest. Without a heuristic this is plain
+    Dijkstra with early termination.
+    
+    Returns:
+        (distance, path), or (inf, []) if end_node is unreachable
+    """
+    if start_node not in graph:
+        raise KeyError(f"Start node {start_node} not in graph")
+    if heuristic is None:
+        heuristic = lambda v: 0.0
+    
+    inf = float('inf')
+    g_score: Dict[int, float] = {start_node: 0.0}
+    predecessors: Dict[int, int] = {}
+    # Entries are (priority, g, vertex); g tells outdated entries apart
+    pq: List[Tuple[float, float, int]] = [(heuristic(start_node), 0.0, start_node)]
     
     while pq:
-        current_dist, u = heapq.heappop(pq)
-        
-        if u == end_node:
-            break  # Early termination when target is reached
+        _, current_dist, u = heapq.heappop(pq)
         
-        if u in visited:
+        # Skip outdated entries
+        if current_dist > g_score[u]:
             continue
         
-        visited.add(u)
-        
-        if current_dist > distances[u]:
-            continue
+        if u == end_node:
+            break
         
         for v, weight in graph.get(u, []):
-            new_distance = distances[u] + weight
-            
-            if new_distance < distances[v]:
-                distances[v] = new_distance
+            if weight < 0:
+                raise ValueError(
+                    f"Dijkstra's algorithm cannot handle negative weights. "
+                    f"Found edge with weight {weight}. Use Bellman-Ford instead."
+                )
+            new_distance = current_dist + weight
+            if new_distance < g_score.get(v, inf):
+                g_score[v] = new_distance
                 predecessors[v] = u
-                heapq.heappush(pq, (new_distance, v))
-    
-    # Reconstruct path
-    if distances[end_node] == float('inf'):
-        return (float('inf'), [])
+                heapq.heappush(pq, (new_distance + heuristic(v), new_distance, v))
     
-    path: List[int] = []
-    current = end_node
-    while current != start_node:
-        path.append(current)
-        if current not in predecessors:
-            return (float('inf'), [])
-        current = predecessors[current]
-    path.append(start_node)
-    path.reverse()
+    if end_node not in g_score:
+        return (inf, [])
     
-    return (distances[end_node], path)
+    return (g_score[end_node], _path_to(predecessors, start_node, end_node))
 
 
 # Example usage
@@ -164,9 +428,10 @@ if __name__ == "__main__":
     }
     
     print("Finding shortest paths from node 0:")
-    distances2 = dijkstra(road_network, 0)
+    distances2, predecessors2 = dijkstra_all_paths(road_network, 0)
     for node in sorted(distances2.keys()):
-        dist, path = dijkstra_with_path(road_network, 0, node)
+        dist = distances2[node]
+        path = _path_to(predecessors2, 0, node) if dist != float('inf') else []
         print(f"  To node {node}: distance={dist}, path={path}")
     
     # Example 3: Demonstrate negative weight detection
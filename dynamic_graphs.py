@@ -3,50 +3,155 @@ Real-time graph analysis engine for hackathon
 Specialized in dynamic graphs, centrality measures, and relationship analysis
 """
 
-from typing import List, Dict, Any
+import math
+from collections import Counter
+from typing import List, Dict, Any, Callable, Iterable, Tuple
 import networkx as nx
 
+try:
+    # Optional C-core backend for the path-based centralities
+    import igraph as ig
+except ImportError:
+    ig = None
+
 """
 Dynamic Graph Engine for Real-time Analysis
 this engine supports dynamic graph structures, centrality measures, and relationship analysis.
 functions:
 - add_edge(node1: str, node2: str, timestamp: float) -> None
 - remove_edge(node1: str, node2: str) -> None
-- get_centrality_measures() -> Dict[str, Any]
+- get_centrality_measures(measures: Iterable[str] = CENTRALITY_MEASURES) -> Dict[str, Any]
+- get_degree_centrality() -> Dict[str, float]
 - get_relationships(node: str) -> List[str]
 - get_time_series_data() -> List[tuple]
 
 add_edge: Adds an edge to the graph with a timestamp.
 remove_edge: Removes an edge from the graph.
-get_centrality_measures: Returns various centrality measures.
+get_centrality_measures: Returns the requested centrality measures (each cached until the graph changes).
+get_degree_centrality: Returns degree centrality from incrementally maintained degrees.
 get_relationships: Returns all relationships (neighbors) of a given node.
 get_time_series_data: Returns the time series data of edges added.
 """
+
+# Measures understood by get_centrality_measures, in output order
+CENTRALITY_MEASURES = ('degree', 'betweenness', 'closeness', 'eigenvector')
+
 class DynamicGraphEngine:
     def __init__(self):
         self.graph = nx.Graph()
         self.time_series_data = []
+        # time_series_data stays in timestamp order while edges arrive in order
+        self._sorted = True
+        self._last_ts = float('-inf')
+        # Bumped on every mutation; centrality results are cached per version
+        self._version = 0
+        # Per-engine cache: name -> (version it was computed at, result)
+        self._centrality_cache: Dict[str, Tuple[int, Any]] = {}
+        # Node degrees kept in step with self.graph (a self-loop counts twice)
+        self._degree: Counter = Counter()
 
     def add_edge(self, node1: str, node2: str, timestamp: float):
         """Add an edge to the graph with a timestamp."""
+        if not self.graph.has_edge(node1, node2):
+            self._degree[node1] += 1
+            self._degree[node2] += 1
         self.graph.add_edge(node1, node2, timestamp=timestamp)
+        if timestamp < self._last_ts:
+            self._sorted = False
+        self._last_ts = timestamp
         self.time_series_data.append((timestamp, node1, node2))
+        self._version += 1
 
     def remove_edge(self, node1: str, node2: str):
         """Remove an edge from the graph."""
         if self.graph.has_edge(node1, node2):
             self.graph.remove_edge(node1, node2)
+            self._degree[node1] -= 1
+            self._degree[node2] -= 1
+            self._version += 1
+
+    # Each heavy measure is cached on this engine together with the version it
+    # was computed at; a mutation bumps the version, so a stale entry is
+    # recomputed on its next use. When igraph is installed they run on an
+    # igraph copy of the graph and are rescaled to networkx's normalisation;
+    # otherwise networkx computes them directly.
+    def _cached(self, name: str, compute: Callable[[], Any]) -> Any:
+        entry = self._centrality_cache.get(name)
+        if entry is not None and entry[0] == self._version:
+            return entry[1]
+        result = compute()
+        self._centrality_cache[name] = (self._version, result)
+        return result
+
+    def _igraph_mirror(self) -> Tuple[Any, List[str]]:
+        def build() -> Tuple[Any, List[str]]:
+            nodes = list(self.graph.nodes)
+            index = {node: i for i, node in enumerate(nodes)}
+            mirror = ig.Graph(n=len(nodes), edges=[(index[u], index[v]) for u, v in self.graph.edges()])
+            return mirror, nodes
+        return self._cached('mirror', build)
 
-    def get_centrality_measures(self) -> Dict[str, Any]:
-        """Calculate and return various centrality measures."""
-        centrality_measures = {
-            'degree_centrality': nx.degree_centrality(self.graph),
-            'betweenness_centrality': nx.betweenness_centrality(self.graph),
-            'closeness_centrality': nx.closeness_centrality(self.graph),
-            'eigenvector_centrality': nx.eigenvector_centrality(self.graph)
+    def _betweenness_centrality(self) -> Dict[str, float]:
+        if ig is None:
+            return nx.betweenness_centrality(self.graph)
+        mirror, nodes = self._igraph_mirror()
+        n = len(nodes)
+        # igraph counts each unordered pair once; networkx normalises by (n-1)(n-2)/2
+        scale = 2.0 / ((n - 1) * (n - 2)) if n > 2 else 1.0
+        return {node: value * scale for node, value in zip(nodes, mirror.betweenness(directed=False))}
+
+    def _closeness_centrality(self) -> Dict[str, float]:
+        if ig is None:
+            return nx.closeness_centrality(self.graph)
+        mirror, nodes = self._igraph_mirror()
+        n = len(nodes)
+        if n <= 1:
+            return {node: 0.0 for node in nodes}
+        membership = mirror.connected_components().membership
+        component_size = Counter(membership)
+        closeness = mirror.closeness(normalized=True)
+        # igraph only averages over reachable nodes; networkx also weights by
+        # the reachable fraction (its wf_improved correction)
+        return {
+            node: 0.0 if math.isnan(value) else value * (component_size[membership[i]] - 1) / (n - 1)
+            for i, (node, value) in enumerate(zip(nodes, closeness))
         }
+
+    def _eigenvector_centrality(self) -> Dict[str, float]:
+        if ig is None:
+            return nx.eigenvector_centrality(self.graph)
+        mirror, nodes = self._igraph_mirror()
+        values = mirror.eigenvector_centrality()
+        # igraph scales the largest entry to 1; networkx uses unit Euclidean norm
+        norm = math.sqrt(sum(value * value for value in values)) or 1.0
+        return {node: value / norm for node, value in zip(nodes, values)}
+
+    def get_centrality_measures(self, measures: Iterable[str] = CENTRALITY_MEASURES) -> Dict[str, Any]:
+        """Calculate and return the requested centrality measures.
+
+        Only the measures named in `measures` (see CENTRALITY_MEASURES) are
+        computed, and each is reused until the graph next changes. Degree
+        centrality comes from the maintained degree counts, skipping networkx.
+        """
+        centrality_measures = {}
+        for measure in measures:
+            if measure not in CENTRALITY_MEASURES:
+                raise ValueError(f"Unknown centrality measure: {measure}")
+            if measure == 'degree':
+                centrality_measures['degree_centrality'] = self.get_degree_centrality()
+                continue
+            compute = getattr(self, f"_{measure}_centrality")
+            # A copy, so callers editing the result cannot alter the cache
+            centrality_measures[f"{measure}_centrality"] = dict(self._cached(measure, compute))
         return centrality_measures
 
+    def get_degree_centrality(self) -> Dict[str, float]:
+        """Degree centrality from the maintained degree counts, without touching networkx."""
+        if len(self._degree) <= 1:
+            return {node: 1.0 for node in self._degree}
+        scale = 1.0 / (len(self._degree) - 1)
+        return {node: degree * scale for node, degree in self._degree.items()}
+
     def get_relationships(self, node: str) -> List[str]:
         """Get all relationships (neighbors) of a given node."""
         if self.graph.has_node(node):
@@ -54,8 +159,13 @@ class DynamicGraphEngine:
         return []
 
     def get_time_series_data(self) -> List[tuple]:
-        """Return the time series data of edges added."""
-        return sorted(self.time_series_data, key=lambda x: x[0])
+        """Return the time series data of edges added, ordered by timestamp."""
+        if not self._sorted:
+            # Stable sort in place so later in-order inserts keep it sorted
+            self.time_series_data.sort(key=lambda x: x[0])
+            self._last_ts = self.time_series_data[-1][0]
+            self._sorted = True
+        return list(self.time_series_data)
     
 # Example usage:
 if __name__ == "__main__":
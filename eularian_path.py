@@ -11,8 +11,8 @@ has_eularian_path: Check if the graph has an eularian path.
 find_eularian_path: Find the eularian path in the graph if it exists.
 """
 
-from typing import List, Tuple, Dict
-from collections import defaultdict, deque
+from array import array
+from typing import List, Tuple
 
 def has_eularian_path(num_nodes: int, edges: List[Tuple[int, int]]) -> bool:
     """Check if the graph has an eularian path."""
@@ -29,30 +29,59 @@ def find_eularian_path(num_nodes: int, edges: List[Tuple[int, int]]) -> List[int
     if not has_eularian_path(num_nodes, edges):
         return []
 
-    graph = defaultdict(deque)
+    # CSR adjacency: both directions of edge i are stored, each tagged with
+    # the edge id i, so consuming it from one endpoint marks it used for the
+    # other in O(1). Row u is neighbors/edge_ids[indptr[u]:indptr[u + 1]].
+    num_edges = len(edges)
+    indptr = array('i', bytes(4 * (num_nodes + 1)))
     for u, v in edges:
-        graph[u].append(v)
-        graph[v].append(u)
+        indptr[u + 1] += 1
+        indptr[v + 1] += 1
+    for u in range(num_nodes):
+        indptr[u + 1] += indptr[u]
+    neighbors = array('i', bytes(8 * num_edges))
+    edge_ids = array('i', bytes(8 * num_edges))
+    cursor = indptr[:num_nodes]
+    for edge_id, (u, v) in enumerate(edges):
+        neighbors[cursor[u]] = v
+        edge_ids[cursor[u]] = edge_id
+        cursor[u] += 1
+        neighbors[cursor[v]] = u
+        edge_ids[cursor[v]] = edge_id
+        cursor[v] += 1
+    used = bytearray(num_edges)
 
     start_node = 0
     for i in range(num_nodes):
-        if len(graph[i]) % 2 != 0:
+        if (indptr[i + 1] - indptr[i]) % 2 != 0:
             start_node = i
             break
 
-    path = []
+    # Hierholzer finishes vertices in reverse path order, so the path is
+    # filled from its last slot backwards instead of appended and reversed
+    path = [0] * (num_edges + 1)
+    tail = num_edges
     stack = [start_node]
 
+    # head[u] is the next unexamined slot of row u; it only moves forward
+    head = indptr[:num_nodes]
     while stack:
         u = stack[-1]
-        if graph[u]:
-            v = graph[u].popleft()
-            graph[v].remove(u)
-            stack.append(v)
+        pos = head[u]
+        row_end = indptr[u + 1]
+        # Skip edges already traversed from the other endpoint
+        while pos < row_end and used[edge_ids[pos]]:
+            pos += 1
+        if pos < row_end:
+            used[edge_ids[pos]] = 1
+            head[u] = pos + 1
+            stack.append(neighbors[pos])
         else:
-            path.append(stack.pop())
+            head[u] = pos
+            path[tail] = stack.pop()
+            tail -= 1
 
-    return path[::-1]
+    return path[tail + 1:]
 
 # Example usage:
 if __name__ == "__main__":
@@ -13,32 +13,61 @@ def floyd_warshall(graph: Dict[int, List[Tuple[int, float]]]) -> Dict[Tuple[int,
     """Perform the Floyd-Warshall algorithm to find shortest paths between all pairs of nodes.
     
     param graph: Dict[int, List[Tuple[int, float]]]: The adjacency list of the graph with edge weights.
+    Distances are kept in a dense list-of-rows matrix over compact node
+    indices rather than a dict keyed by (i, j) tuples, and each pivot row is
+    packed down to its finite entries once per k.
+    A self-loop never replaces the 0 distance from a node to itself, parallel
+    edges keep their smallest weight, and nodes that only appear as neighbours
+    get full rows and columns of shortest distances.
     Returns a dictionary with the shortest distance between each pair of nodes.
     Raises a ValueError if a negative weight cycle is detected.
     """
-    # Initialize distances with infinity
+    # Map nodes to matrix indices 0..V-1 (nodes that only appear as neighbours included)
     nodes = list(graph.keys())
-    distances = {(i, j): float('inf') for i in nodes for j in nodes}
+    node_index = {node: i for i, node in enumerate(nodes)}
+    for neighbors in graph.values():
+        for neighbor, _ in neighbors:
+            if neighbor not in node_index:
+                node_index[neighbor] = len(nodes)
+                nodes.append(neighbor)
+    n = len(nodes)
+
+    # Dense V x V matrix, one list per row, initialised to infinity
+    inf = float('inf')
+    dist = [[inf] * n for _ in range(n)]
     
     # Set distance to self as 0 and direct edges as their weights
-    for node in nodes:
-        distances[(node, node)] = 0.0
-        for neighbor, weight in graph[node]:
-            distances[(node, neighbor)] = weight
-
-    # Floyd-Warshall algorithm
-    for k in nodes:
-        for i in nodes:
-            for j in nodes:
-                if distances[(i, k)] + distances[(k, j)] < distances[(i, j)]:
-                    distances[(i, j)] = distances[(i, k)] + distances[(k, j)]
+    for i in range(n):
+        dist[i][i] = 0.0
+    for node, neighbors in graph.items():
+        row = dist[node_index[node]]
+        for neighbor, weight in neighbors:
+            j = node_index[neighbor]
+            if weight < row[j]:
+                row[j] = weight
+
+    # Floyd-Warshall algorithm: for each pivot k, the finite entries of row k
+    # are packed once into (j, d_kj) pairs and reused by every row i, so the
+    # inner loop never touches an infinite d_kj; rows that cannot reach k are
+    # skipped entirely. Row k only changes during its own pass when d_kk < 0,
+    # which is a negative cycle and is reported below either way.
+    for k in range(n):
+        finite_k = [(j, d_kj) for j, d_kj in enumerate(dist[k]) if d_kj != inf]
+        for row_i in dist:
+            d_ik = row_i[k]
+            if d_ik == inf:
+                continue
+            for j, d_kj in finite_k:
+                candidate = d_ik + d_kj
+                if candidate < row_i[j]:
+                    row_i[j] = candidate
 
     # Check for negative weight cycles
-    for node in nodes:
-        if distances[(node, node)] < 0:
+    for i in range(n):
+        if dist[i][i] < 0:
             raise ValueError("Graph contains a negative weight cycle")
 
-    return distances
+    return {(u, v): dist[i][j] for i, u in enumerate(nodes) for j, v in enumerate(nodes)}
 
 # Example usage
 if __name__ == "__main__":
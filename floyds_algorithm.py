@@ -3,60 +3,121 @@ floyd's algorithm to find shortest paths in a weighted graph with positive or ne
 
 functions:
 - floyd_warshall(graph): Implements Floyd's algorithm to find shortest paths.
-- find_cycle(graph): Detects cycles in the graph using Floyd's algorithm.
+- find_cycle(graph): Detects cycles in the graph along first edges.
 - get_cycle_length(graph): Returns the length of the cycle if one exists.
 
 """
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import math
 
+# Every int of magnitude up to this is exactly representable as a float
+EXACT_FLOAT_LIMIT = 1 << 53
+
+def _relax_all_pairs(dist: List[List[float]]) -> None:
+    """Floyd-Warshall relaxation, in place, over a square distance matrix.
+
+    Only the k loop carries a dependency: for a fixed k every row i is updated
+    independently, reading row k and the scalar dist[i][k], which are hoisted
+    out of the j loop. Rows that cannot reach k are skipped.
+    """
+    num_nodes = len(dist)
+    for k in range(num_nodes):
+        row_k = dist[k]
+        for i in range(num_nodes):
+            row_i = dist[i]
+            d_ik = row_i[k]
+            if d_ik == math.inf:
+                continue
+            for j in range(num_nodes):
+                candidate = d_ik + row_k[j]
+                if candidate < row_i[j]:
+                    row_i[j] = candidate
+
+def _integral_copy(graph: List[List[float]]) -> Optional[List[List[float]]]:
+    """Copy of the matrix with whole-number float weights turned into ints, or None.
+
+    None means there is nothing to gain: some weight has a fractional part (or
+    is nan/-inf), every finite weight already is an int, or the weights are
+    not small. Small ints add and compare faster than floats; math.inf is kept
+    as the "no edge" sentinel and is never added to. A shortest path has fewer
+    than num_nodes edges, so while num_nodes * max|w| <= EXACT_FLOAT_LIMIT
+    every distance converts back to exactly the float the float path gives.
+    """
+    has_float = False
+    max_abs = 0
+    for row in graph:
+        for weight in row:
+            if weight == math.inf:
+                continue
+            if type(weight) is not int:
+                if not (isinstance(weight, float) and weight.is_integer()):
+                    return None
+                has_float = True
+            max_abs = max(max_abs, abs(weight))
+    if not has_float or len(graph) * max_abs > EXACT_FLOAT_LIMIT:
+        return None
+    return [[weight if weight == math.inf else int(weight) for weight in row] for row in graph]
+
 def floyd_warshall(graph: List[List[float]]) -> List[List[float]]:
     """Implements Floyd's algorithm to find shortest paths.
 
     Args:
         graph (List[List[float]]): Adjacency matrix representing the graph. Use float('inf') for no edge.
+            Whole-number float weights are relaxed as ints and returned as floats.
 
     Returns:
         List[List[float]]: Matrix of shortest path distances between all pairs of nodes.
     """
     num_nodes = len(graph)
-    dist = [[math.inf] * num_nodes for _ in range(num_nodes)]
-
+    dist = _integral_copy(graph)
+    quantized = dist is not None
+    if not quantized:
+        dist = [list(row) for row in graph]
     for i in range(num_nodes):
-        for j in range(num_nodes):
-            dist[i][j] = graph[i][j]
         dist[i][i] = 0
 
-    for k in range(num_nodes):
-        for i in range(num_nodes):
-            for j in range(num_nodes):
-                if dist[i][k] + dist[k][j] < dist[i][j]:
-                    dist[i][j] = dist[i][k] + dist[k][j]
-
+    _relax_all_pairs(dist)
+    if quantized:
+        # Back to the float values the caller passed in
+        return [[d if d == math.inf else float(d) for d in row] for row in dist]
     return dist
 
+def _first_cycle_length(graph: Dict[int, List[int]]) -> int:
+    """Length of the first cycle reached by following each node's first edge, or -1.
+
+    Every node has at most one successor here (graph[node][0]), so the walk from
+    a start either ends at a dead end or runs into a cycle. Nodes on the current
+    walk are GRAY and remember their step number; meeting a GRAY node again
+    closes a cycle whose length is the difference in steps. Once a walk ends its
+    nodes turn BLACK and later walks stop as soon as they reach one, so each
+    node is stepped onto O(1) times overall instead of once per start.
+    """
+    black = set()
+    for start_node in graph:
+        if start_node in black:
+            continue
+        gray: Dict[int, int] = {}  # node -> step at which this walk reached it
+        node = start_node
+        while node is not None and node not in black:
+            step = gray.get(node)
+            if step is not None:
+                return len(gray) - step
+            gray[node] = len(gray)
+            successors = graph.get(node)
+            node = successors[0] if successors else None
+        black.update(gray)
+    return -1
+
 def find_cycle(graph: Dict[int, List[int]]) -> bool:
-    """Detects cycles in the graph using Floyd's algorithm.
+    """Detects cycles in the graph by following each node's first edge.
 
     Args:
         graph (Dict[int, List[int]]): Adjacency list representing the graph.
     Returns:
         bool: True if a cycle is detected, False otherwise.
     """
-    for start_node in graph:
-        slow = start_node
-        fast = start_node
-
-        while True:
-            if slow not in graph or fast not in graph or not graph[fast]:
-                break
-            slow = graph[slow][0]
-            fast = graph[graph[fast][0]][0]
-
-            if slow == fast:
-                return True
-    return False
+    return _first_cycle_length(graph) != -1
 
 def get_cycle_length(graph: Dict[int, List[int]]) -> int:
     """Returns the length of the cycle if one exists.
@@ -67,24 +128,7 @@ def get_cycle_length(graph: Dict[int, List[int]]) -> int:
     Returns:
         int: Length of the cycle if detected, otherwise -1.
     """
-    for start_node in graph:
-        slow = start_node
-        fast = start_node
-
-        while True:
-            if slow not in graph or fast not in graph or not graph[fast]:
-                break
-            slow = graph[slow][0]
-            fast = graph[graph[fast][0]][0]
-
-            if slow == fast:
-                cycle_length = 1
-                current = graph[slow][0]
-                while current != slow:
-                    cycle_length += 1
-                    current = graph[current][0]
-                return cycle_length
-    return -1
+    return _first_cycle_length(graph)
 
 # Example usage:
 if __name__ == "__main__":
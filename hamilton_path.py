@@ -6,59 +6,82 @@ functions:
 - has_hamiltonian_path(num_nodes: int, edges: List[Tuple[int, int]]) -> bool
 - find_hamiltonian_path(num_nodes: int, edges: List[Tuple[int, int]]) -> List[int]
 
+Both use the Held-Karp style dp over (last node, visited set) states, memoised,
+which takes O(n^2 * 2^n) time instead of the O(n!) of plain backtracking.
+
 """
 
-from typing import List, Tuple, Dict
-from collections import defaultdict
+from typing import List, Tuple, Callable, Optional
+from functools import lru_cache
 
-def has_hamiltonian_path(num_nodes: int, edges: List[Tuple[int, int]]) -> bool:
-    """Check if the graph has a hamiltonian path using backtracking."""
-    graph = defaultdict(list)
+def _adjacency_masks(num_nodes: int, edges: List[Tuple[int, int]]) -> List[int]:
+    """Bit u of adj_mask[v] is set when v and u are adjacent."""
+    adj_mask = [0] * num_nodes
     for u, v in edges:
-        graph[u].append(v)
-        graph[v].append(u)
+        adj_mask[u] |= 1 << v
+        adj_mask[v] |= 1 << u
+    return adj_mask
+
+def _reachability(num_nodes: int, adj_mask: List[int]) -> Callable[[int, int], bool]:
+    """Build reach(v, visited): can a path ending at v, having used the nodes in
+    the bitmask visited, be extended to cover every node?
+
+    Results are memoised per (v, visited) state, the Held-Karp formulation, so the
+    search is O(n^2 * 2^n) instead of re-exploring every ordering of a prefix.
+    """
+    full = (1 << num_nodes) - 1
 
-    def backtrack(path):
-        if len(path) == num_nodes:
+    @lru_cache(maxsize=None)
+    def reach(v, visited):
+        if visited == full:
             return True
-        last_node = path[-1]
-        for neighbor in graph[last_node]:
-            if neighbor not in path:
-                path.append(neighbor)
-                if backtrack(path):
-                    return True
-                path.pop()
+        candidates = adj_mask[v] & ~visited
+        while candidates:
+            bit = candidates & -candidates
+            candidates ^= bit
+            if reach(bit.bit_length() - 1, visited | bit):
+                return True
         return False
 
-    for start_node in range(num_nodes):
-        if backtrack([start_node]):
-            return True
-    return False
+    return reach
 
-def find_hamiltonian_path(num_nodes: int, edges: List[Tuple[int, int]]) -> List[int]:
-    """Find the hamiltonian path in the graph if it exists."""
-    graph = defaultdict(list)
-    for u, v in edges:
-        graph[u].append(v)
-        graph[v].append(u)
+def _search(num_nodes: int, adj_mask: List[int]) -> Optional[List[int]]:
+    """Return a hamiltonian path as a list of nodes, or None if there is none.
 
-    def backtrack(path):
-        if len(path) == num_nodes:
-            return True
-        last_node = path[-1]
-        for neighbor in graph[last_node]:
-            if neighbor not in path:
-                path.append(neighbor)
-                if backtrack(path):
-                    return True
-                path.pop()
-        return False
+    has_ and find_ share this: the memoised reach() decides each start node, and
+    the path is read back by walking the already-memoised states, always stepping
+    to a neighbor that can still finish.
+    """
+    reach = _reachability(num_nodes, adj_mask)
+    full = (1 << num_nodes) - 1
 
     for start_node in range(num_nodes):
+        visited = 1 << start_node
+        if not reach(start_node, visited):
+            continue
         path = [start_node]
-        if backtrack(path):
-            return path
-    return []
+        last_node = start_node
+        while visited != full:
+            candidates = adj_mask[last_node] & ~visited
+            while candidates:
+                bit = candidates & -candidates
+                candidates ^= bit
+                if reach(bit.bit_length() - 1, visited | bit):
+                    break
+            last_node = bit.bit_length() - 1
+            visited |= bit
+            path.append(last_node)
+        return path
+    return None
+
+def has_hamiltonian_path(num_nodes: int, edges: List[Tuple[int, int]]) -> bool:
+    """Check if the graph has a hamiltonian path using bitmask dynamic programming."""
+    return _search(num_nodes, _adjacency_masks(num_nodes, edges)) is not None
+
+def find_hamiltonian_path(num_nodes: int, edges: List[Tuple[int, int]]) -> List[int]:
+    """Find the hamiltonian path in the graph if it exists."""
+    path = _search(num_nodes, _adjacency_masks(num_nodes, edges))
+    return path if path is not None else []
 
 # Example usage:
 if __name__ == "__main__":
@@ -9,53 +9,79 @@ knights_tour: Find a knight's tour on an n x n chessboard starting from (start_x
 
 """
 
+from functools import lru_cache
 from typing import List, Tuple, Optional
 
-def is_valid_move(x: int, y: int, n: int, visited: List[List[bool]]) -> bool:
-    return 0 <= x < n and 0 <= y < n and not visited[x][y]
+MOVES = (
+    (2, 1), (1, 2), (-1, 2), (-2, 1),
+    (-2, -1), (-1, -2), (1, -2), (2, -1)
+)
 
-def knights_tour(n: int, start_x: int = 0, start_y: int = 0) -> Optional[List[Tuple[int, int]]]:
-    moves = [
-        (2, 1), (1, 2), (-1, 2), (-2, 1),
-        (-2, -1), (-1, -2), (1, -2), (2, -1)
-    ]
-
-    def count_onward_moves(x: int, y: int, visited: List[List[bool]]) -> int:
-        count = 0
-        for dx, dy in moves:
-            if is_valid_move(x + dx, y + dy, n, visited):
-                count += 1
-        return count
-
-    def backtrack(x: int, y: int, move_count: int, path: List[Tuple[int, int]], visited: List[List[bool]]) -> bool:
-        if move_count == n * n:
-            return True
+@lru_cache(maxsize=None)
+def _knight_neighbors(n: int) -> Tuple[Tuple[int, ...], ...]:
+    """Squares a knight reaches from each square of an n x n board.
 
-        next_moves = []
-        for dx, dy in moves:
-            nx, ny = x + dx, y + dy
-            if is_valid_move(nx, ny, n, visited):
-                onward_moves = count_onward_moves(nx, ny, visited)
-                next_moves.append((onward_moves, nx, ny))
+    Squares are numbered x * n + y. The table depends on n alone, so it is
+    built once per board size and reused by every later tour on that size;
+    the solver then needs no bounds checks or coordinate arithmetic.
+    """
+    return tuple(
+        tuple(
+            (x + dx) * n + (y + dy)
+            for dx, dy in MOVES
+            if 0 <= x + dx < n and 0 <= y + dy < n
+        )
+        for x in range(n)
+        for y in range(n)
+    )
 
-        next_moves.sort()  # Sort by number of onward moves (Warnsdorf's rule)
+def _solve(size: int, start: int, neighbors: Tuple[Tuple[int, ...], ...], path: List[int]) -> bool:
+    """Iterative Warnsdorf backtracking; leaves the tour in path on success.
 
-        for _, nx, ny in next_moves:
-            visited[nx][ny] = True
-            path.append((nx, ny))
-            if backtrack(nx, ny, move_count + 1, path, visited):
-                return True
-            visited[nx][ny] = False
-            path.pop()
+    neighbors[s] holds the squares a knight can reach from square s. Each
+    depth keeps its untried candidates on an explicit stack as ints
+    onward * size + square, sorted descending so the best one pops off the
+    end. There is no recursion, so large boards do not hit the recursion limit.
+    """
+    visited = bytearray(size)
+    stack = []
+    visited[start] = 1
+    path.append(start)
+    square = start
+    while True:
+        if len(path) == size:
+            return True
 
-        return False
+        # Warnsdorf's rule: try squares with the fewest onward moves first. The
+        # key onward * size + square sorts like (onward, x, y) without tuples.
+        ranked = []
+        for nxt in neighbors[square]:
+            if not visited[nxt]:
+                onward_moves = 0
+                for onward in neighbors[nxt]:
+                    if not visited[onward]:
+                        onward_moves += 1
+                ranked.append(onward_moves * size + nxt)
+        ranked.sort(reverse=True)
+        stack.append(ranked)
 
-    visited = [[False] * n for _ in range(n)]
-    visited[start_x][start_y] = True
-    path = [(start_x, start_y)]
+        # Take the next untried candidate, stepping back past exhausted depths
+        while True:
+            ranked = stack[-1]
+            if ranked:
+                square = ranked.pop() % size
+                visited[square] = 1
+                path.append(square)
+                break
+            stack.pop()
+            if not stack:
+                return False
+            visited[path.pop()] = 0
 
-    if backtrack(start_x, start_y, 1, path, visited):
-        return path
+def knights_tour(n: int, start_x: int = 0, start_y: int = 0) -> Optional[List[Tuple[int, int]]]:
+    path: List[int] = []
+    if _solve(n * n, start_x * n + start_y, _knight_neighbors(n), path):
+        return [divmod(square, n) for square in path]
     else:
         return None
     
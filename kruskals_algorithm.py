@@ -6,28 +6,41 @@ functions:
 kruskals_algorithm: Find the minimum spanning tree using Kruskal's algorithm.
 """
 
+from array import array
+from operator import itemgetter
+
 class DisjointSet:
     def __init__(self, n):
-        self.parent = list(range(n))
-        self.rank = [0] * n
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
 
     def find(self, u):
-        if self.parent[u] != u:
-            self.parent[u] = self.find(self.parent[u])
-        return self.parent[u]
+        parent = self.parent
+        # First pass: walk up to the root
+        root = u
+        while parent[root] != root:
+            root = parent[root]
+        # Second pass: point every node on the way directly at the root
+        while parent[u] != root:
+            next_node = parent[u]
+            parent[u] = root
+            u = next_node
+        return root
 
     def union(self, u, v):
         root_u = self.find(u)
         root_v = self.find(v)
 
         if root_u != root_v:
-            if self.rank[root_u] > self.rank[root_v]:
-                self.parent[root_v] = root_u
-            elif self.rank[root_u] < self.rank[root_v]:
-                self.parent[root_u] = root_v
-            else:
-                self.parent[root_v] = root_u
-                self.rank[root_u] += 1
+            self.union_roots(root_u, root_v)
+
+    def union_roots(self, root_u, root_v):
+        """Merge two distinct sets given their roots (as returned by find)."""
+        # Union by size: hang the smaller tree under the larger one
+        if self.size[root_u] < self.size[root_v]:
+            root_u, root_v = root_v, root_u
+        self.parent[root_v] = root_u
+        self.size[root_u] += self.size[root_v]
 
 def kruskals_algorithm(num_nodes, edges):
     """Find the minimum spanning tree using Kruskal's algorithm.
@@ -39,16 +52,21 @@ def kruskals_algorithm(num_nodes, edges):
     Returns:
         List[Tuple[int, int, float]]: Edges in the minimum spanning tree.
     """
-    # Sort edges based on their weights
-    edges.sort(key=lambda x: x[2])
+    # Sort edges based on their weights (itemgetter extracts the key in C)
+    edges.sort(key=itemgetter(2))
     
     disjoint_set = DisjointSet(num_nodes)
     mst_edges = []
 
     for u, v, weight in edges:
-        if disjoint_set.find(u) != disjoint_set.find(v):
-            disjoint_set.union(u, v)
+        root_u = disjoint_set.find(u)
+        root_v = disjoint_set.find(v)
+        if root_u != root_v:
+            disjoint_set.union_roots(root_u, root_v)
             mst_edges.append((u, v, weight))
+            # A spanning tree has num_nodes - 1 edges; the rest cannot be used
+            if len(mst_edges) == num_nodes - 1:
+                break
 
     return mst_edges
 
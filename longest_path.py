@@ -30,53 +30,64 @@ theory:
 - This involves two main steps: calculating the maximum lengths from children and then from the parent.
 - Finally, we combine these lengths to get the longest path for each node.
 """
+def _preorder(root: TreeNode) -> list:
+    # Nodes in pre-order, collected with an explicit stack: every node comes
+    # before its children, so reversing the list gives a valid post-order
+    order = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        stack.extend(reversed(node.children))
+    return order
+
+def _fill_from_children(order: list) -> None:
+    # Children appear after their parent in pre-order, so walking it backwards
+    # finishes every child before its parent needs it
+    for node in reversed(order):
+        first = second = 0  # The top two lengths
+        for child in node.children:
+            child_length = child.max_length_from_children + 1
+            if child_length > first:
+                second = first
+                first = child_length
+            elif child_length > second:
+                second = child_length
+        node.max_length_from_children = first
+        node.second_max_length_from_children = second
+
+def _fill_from_parent(order: list) -> None:
+    # Pre-order: a node's own value is final before its children are updated
+    for node in order:
+        from_parent = node.max_length_from_parent + 1
+        for child in node.children:
+            if node.max_length_from_children == child.max_length_from_children + 1:
+                child.max_length_from_parent = max(node.second_max_length_from_children + 1, from_parent)
+            else:
+                child.max_length_from_parent = max(node.max_length_from_children + 1, from_parent)
+
 def calculate_max_lengths_from_children(node: TreeNode) -> int:
     if not node:
         return 0
     
-    max_lengths = [0, 0]  # Store the top two lengths
-    for child in node.children:
-        child_length = calculate_max_lengths_from_children(child)
-        if child_length > max_lengths[0]:
-            max_lengths[1] = max_lengths[0]
-            max_lengths[0] = child_length
-        elif child_length > max_lengths[1]:
-            max_lengths[1] = child_length
-    
-    node.max_length_from_children = max_lengths[0]
-    node.second_max_length_from_children = max_lengths[1]
-    
+    _fill_from_children(_preorder(node))
     return node.max_length_from_children + 1
 
 def calculate_max_lengths_from_parent(node: TreeNode):
     if not node:
         return
     
-    for child in node.children:
-        if node.max_length_from_children == child.max_length_from_children + 1:
-            child.max_length_from_parent = max(node.second_max_length_from_children + 1, node.max_length_from_parent + 1)
-        else:
-            child.max_length_from_parent = max(node.max_length_from_children + 1, node.max_length_from_parent + 1)
-        
-        calculate_max_lengths_from_parent(child)
+    _fill_from_parent(_preorder(node))
 
 def calculate_longest_paths(root: TreeNode) -> dict:
-    calculate_max_lengths_from_children(root)
+    # One traversal order serves all three passes; no recursion, so deep
+    # trees cannot hit the recursion limit
+    order = _preorder(root)
+    _fill_from_children(order)
     root.max_length_from_parent = 0
-    calculate_max_lengths_from_parent(root)
-    
-    longest_paths = {}
-    
-    def collect_longest_paths(node: TreeNode):
-        if not node:
-            return
-        longest_paths[node.value] = max(node.max_length_from_children, node.max_length_from_parent)
-        for child in node.children:
-            collect_longest_paths(child)
-    
-    collect_longest_paths(root)
+    _fill_from_parent(order)
     
-    return longest_paths
+    return {node.value: max(node.max_length_from_children, node.max_length_from_parent) for node in order}
 
 # Example usage:
 if __name__ == "__main__":
@@ -7,12 +7,15 @@ queries that ask to find the lowest common ancestor of two nodes.
 functions:
 - lowest_common_ancestor(root: TreeNode, node1: TreeNode, node2: TreeNode) -> TreeNode
 - find_path(root: TreeNode, target: TreeNode, path: List[TreeNode]) -> bool
+- EulerTourLCA(root: TreeNode).query(node1: TreeNode, node2: TreeNode) -> TreeNode
 
 lowest_common_ancestor: Find the lowest common ancestor of two nodes in the tree.
 find_path: Helper function to find the path from root to a given target node.
+EulerTourLCA: Preprocess the tree once in O(n log n), then answer each LCA query in O(1).
 
 """
 
+from array import array
 from typing import List, Optional
 
 class TreeNode:
@@ -54,6 +57,62 @@ def lowest_common_ancestor(root: TreeNode, node1: TreeNode, node2: TreeNode) ->
     
     return lca
 
+class EulerTourLCA:
+    """LCA for many queries on one tree, via an Euler tour and a sparse table.
+
+    The Euler tour lists nodes as a DFS enters them and as it returns to them,
+    so the LCA of two nodes is the shallowest node in the tour between their
+    first occurrences. The sparse table stores, for every power of two 2^k and
+    start i, the position of the shallowest node in tour[i:i + 2^k]; two
+    overlapping windows then cover any range, giving O(1) per query.
+    """
+
+    def __init__(self, root: TreeNode):
+        # Iterative Euler tour: record a node on entry and again after each child
+        self.tour: List[TreeNode] = [root]
+        depth = array('i', [0])
+        self.first = {id(root): 0}  # id(node) -> first position in the tour
+        stack = [(root, iter(root.children))]
+        while stack:
+            node, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if stack:
+                    self.tour.append(stack[-1][0])
+                    depth.append(len(stack) - 1)
+            else:
+                self.first[id(child)] = len(self.tour)
+                self.tour.append(child)
+                depth.append(len(stack))
+                stack.append((child, iter(child.children)))
+        self.depth = depth
+
+        # table[k][i] = position of the shallowest node in tour[i:i + 2^k]
+        self.table = [array('i', range(len(self.tour)))]
+        k = 1
+        while (1 << k) <= len(self.tour):
+            prev = self.table[-1]
+            half = 1 << (k - 1)
+            self.table.append(array('i', (
+                a if depth[a] <= depth[b] else b
+                for a, b in zip(prev, prev[half:])
+            )))
+            k += 1
+
+    def query(self, node1: TreeNode, node2: TreeNode) -> Optional[TreeNode]:
+        """Return the lowest common ancestor of node1 and node2, or None if either is not in the tree."""
+        left = self.first.get(id(node1))
+        right = self.first.get(id(node2))
+        if left is None or right is None:
+            return None
+        if left > right:
+            left, right = right, left
+        k = (right - left + 1).bit_length() - 1
+        a = self.table[k][left]
+        b = self.table[k][right - (1 << k) + 1]
+        return self.tour[a if self.depth[a] <= self.depth[b] else b]
+
 # Example usage:
 if __name__ == "__main__":
     # Construct a sample tree
@@ -72,4 +131,9 @@ if __name__ == "__main__":
     if lca_node:
         print("Lowest Common Ancestor of nodes", node1.value, "and", node2.value, "is:", lca_node.value)
     else:
-        print("One or both nodes are not present in the tree.")
\ No newline at end of file
+        print("One or both nodes are not present in the tree.")
+
+    # Many queries on the same tree: preprocess once, then O(1) per query
+    lca_index = EulerTourLCA(root)
+    for a, b in [(node1, node2), (child1.children[0], child1.children[1]), (child3, node2)]:
+        print("LCA of", a.value, "and", b.value, "is:", lca_index.query(a, b).value)
\ No newline at end of file
@@ -1,7 +1,14 @@
 """
 This module defines a class to represent a point in 2D space with x and y coordinates,
 and methods to display the point's information and calculate the distance from another point.
+It also defines Points, which stores many points column-wise for batch distance queries.
 """
+import math
+from array import array
+from itertools import repeat
+from operator import sub
+from typing import Iterable, List, Tuple
+
 class point:
 
     def __init__(self, x:float, y:float) -> None:
@@ -12,7 +19,27 @@ class point:
         print(f"Point coordinates: ({self.x}, {self.y})")
 
     def distance(self, other: "point") -> float:
-        return ((self.x - other.x) ** 2 + (self.y - other.y) ** 2) ** 0.5
+        return math.hypot(self.x - other.x, self.y - other.y)
+
+class Points:
+    """A batch of 2D points stored as two coordinate arrays (xs, ys) instead of one object per point."""
+
+    def __init__(self, coordinates: Iterable[Tuple[float, float]]) -> None:
+        self.xs = array('d')
+        self.ys = array('d')
+        for x, y in coordinates:
+            self.xs.append(x)
+            self.ys.append(y)
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def distance_to(self, x: float, y: float) -> List[float]:
+        # map over the coordinate arrays keeps the whole loop in C
+        return list(map(math.hypot, map(sub, self.xs, repeat(x)), map(sub, self.ys, repeat(y))))
+
+    def pairwise_distance(self, a: int, b: int) -> float:
+        return math.hypot(self.xs[a] - self.xs[b], self.ys[a] - self.ys[b])
 
 # Example usage
 if __name__ == "__main__":
@@ -22,4 +49,7 @@ if __name__ == "__main__":
     point1.display_coordinates()
     point2.display_coordinates()
 
-    print(f"Distance between points: {point1.distance(point2)}")
\ No newline at end of file
+    print(f"Distance between points: {point1.distance(point2)}")
+
+    points = Points([(3, 4), (6, 8), (0, 0)])
+    print(f"Distances from (0, 0): {points.distance_to(0, 0)}")
\ No newline at end of file
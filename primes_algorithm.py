@@ -2,8 +2,48 @@
 Primes algorithm to find minimum spanning trees
 """
 
+from array import array
 from typing import List, Tuple
 import heapq
+import math
+
+def _dense_primes_algorithm(num_nodes: int, edges: List[Tuple[int, int, float]]) -> List[Tuple[int, int, float]]:
+    """Prim's algorithm without a heap, for graphs with close to V^2 edges.
+
+    key[v] is the lightest edge from the tree to v and parent[v] its other end.
+    Each step takes the smallest key (a C-level min/index scan over a list) and
+    relaxes one row of the adjacency matrix, so the total work is O(V^2) with
+    no heap entries at all. Tree nodes keep key inf, so they are never picked again.
+    """
+    inf = math.inf
+    matrix = [[inf] * num_nodes for _ in range(num_nodes)]
+    for u, v, weight in edges:
+        if weight < matrix[u][v]:  # keep the lightest of parallel edges
+            matrix[u][v] = weight
+            matrix[v][u] = weight
+
+    mst_edges = []
+    in_mst = bytearray(num_nodes)
+    key = [inf] * num_nodes
+    parent = [-1] * num_nodes
+    u = 0
+    while True:
+        in_mst[u] = 1
+        key[u] = inf
+        if parent[u] != -1:
+            mst_edges.append((parent[u], u, matrix[parent[u]][u]))
+
+        for v, weight in enumerate(matrix[u]):
+            if weight < key[v] and not in_mst[v]:
+                key[v] = weight
+                parent[v] = u
+
+        smallest = min(key)
+        if smallest == inf:  # the rest of the graph is unreachable from node 0
+            break
+        u = key.index(smallest)
+
+    return mst_edges
 
 def primes_algorithm(num_nodes: int, edges: List[Tuple[int, int, float]]) -> List[Tuple[int, int, float]]:
     """Find the minimum spanning tree using Prim's algorithm.
@@ -15,26 +55,49 @@ def primes_algorithm(num_nodes: int, edges: List[Tuple[int, int, float]]) -> Lis
     Returns:
         List[Tuple[int, int, float]]: Edges in the minimum spanning tree.
     """
-    adjacency_list = {i: [] for i in range(num_nodes)}
+    # Dense graphs: scanning a key array beats a heap holding O(E) entries
+    if num_nodes and len(edges) > num_nodes * num_nodes / 8:
+        return _dense_primes_algorithm(num_nodes, edges)
+
+    # CSR adjacency: the edges of node u are
+    # neighbors/weights[indptr[u]:indptr[u + 1]], each undirected edge stored both ways
+    indptr = array('i', bytes(4 * (num_nodes + 1)))
+    for u, v, _ in edges:
+        indptr[u + 1] += 1
+        indptr[v + 1] += 1
+    for u in range(num_nodes):
+        indptr[u + 1] += indptr[u]
+    neighbors = array('i', bytes(8 * len(edges)))
+    weights = [0] * (2 * len(edges))
+    cursor = indptr[:num_nodes]
     for u, v, weight in edges:
-        adjacency_list[u].append((weight, v))
-        adjacency_list[v].append((weight, u))
+        neighbors[cursor[u]] = v
+        weights[cursor[u]] = weight
+        cursor[u] += 1
+        neighbors[cursor[v]] = u
+        weights[cursor[v]] = weight
+        cursor[v] += 1
 
     mst_edges = []
-    visited = [False] * num_nodes
+    visited = bytearray(num_nodes)
+    # Lightest edge seen so far into each node; heavier ones are never pushed
+    best = [math.inf] * num_nodes
     min_heap = [(0, 0, -1)]  # (weight, current_node, parent_node)
 
     while min_heap:
         weight, current_node, parent_node = heapq.heappop(min_heap)
         if visited[current_node]:
             continue
-        visited[current_node] = True
+        visited[current_node] = 1
         if parent_node != -1:
             mst_edges.append((parent_node, current_node, weight))
 
-        for edge in adjacency_list[current_node]:
-            if not visited[edge[1]]:
-                heapq.heappush(min_heap, (edge[0], edge[1], current_node))
+        for pos in range(indptr[current_node], indptr[current_node + 1]):
+            neighbor = neighbors[pos]
+            edge_weight = weights[pos]
+            if not visited[neighbor] and edge_weight <= best[neighbor]:
+                best[neighbor] = edge_weight
+                heapq.heappush(min_heap, (edge_weight, neighbor, current_node))
 
     return mst_edges
 
@@ -1,8 +1,9 @@
 """
 Dynamic 5x5 labyrinth shortest path using BFS algorithm.
 """
+from array import array
 from collections import deque
-from typing import List, Set, Tuple
+from typing import List, Tuple
 
 # bridge rotation logic
 def bridge_rotates(time: int, position: Tuple[int, int], rows: int, cols: int) -> bool:
@@ -36,33 +37,59 @@ def labyrinth_shortest_path(grid: List[List[str]]) -> Tuple[int, List[Tuple[int,
     if not start or not end:
         return -1, []
     
-    # Initialize BFS
+    # passable[step][r * cols + c]: can (r, c) be entered at a time t with
+    # t % perimeter == step? Walls never, plain cells always, bridges per rotation
+    perimeter = 2 * (rows + cols) - 4
+    passable = [bytearray(rows * cols) for _ in range(perimeter)]
+    for r in range(rows):
+        for c in range(cols):
+            cell = grid[r][c]
+            if cell == '#':
+                continue
+            for step in range(perimeter):
+                if cell != 'B' or bridge_rotates(step, (r, c), rows, cols):
+                    passable[step][r * cols + c] = 1
+
+    # Initialize BFS over states (cell, time % perimeter): the bridges repeat
+    # with that period, so two arrivals in the same state have the same future.
+    # State (r, c, phase) is stored at index (r * cols + c) * perimeter + phase.
     directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]#right, down, left, up
-    queue = deque([(start[0], start[1], 0, [(start[0], start[1])])])
-    visited: Set[Tuple[int, int, int]] = set()#set of (x, y, time%2)
-    visited.add((start[0], start[1], 0))
+    num_states = rows * cols * perimeter
+    visited = bytearray(num_states)
+    parent = array('i', [-1]) * num_states  # state first reached from, for the path
+    start_state = (start[0] * cols + start[1]) * perimeter
+    visited[start_state] = 1
+    queue = deque([(start[0], start[1], 0)])
 
     while queue:
-        x, y, time, path = queue.popleft()
+        x, y, time = queue.popleft()
+        current = (x * cols + y) * perimeter + time % perimeter
 
         if (x, y) == end:
+            path = []
+            state = current
+            while state != -1:
+                path.append(divmod(state // perimeter, cols))
+                state = parent[state]
+            path.reverse()
             return time, path
 
+        ntime = time + 1
+        phase = ntime % perimeter
+        open_now = passable[phase]
         for dx, dy in directions:
             nx, ny = x + dx, y + dy
-            ntime = time + 1
 
             if 0 <= nx < rows and 0 <= ny < cols:
-                cell = grid[nx][ny]
-                if cell == '#':
-                    continue
-                if cell == 'B' and not bridge_rotates(ntime, (nx, ny), rows, cols):
+                cell = nx * cols + ny
+                if not open_now[cell]:
                     continue
 
-                state = (nx, ny, ntime % 2)
-                if state not in visited:
-                    visited.add(state)
-                    queue.append((nx, ny, ntime, path + [(nx, ny)]))
+                state = cell * perimeter + phase
+                if not visited[state]:
+                    visited[state] = 1
+                    parent[state] = current
+                    queue.append((nx, ny, ntime))
 
     return -1, []
 
@@ -8,6 +8,7 @@ functions:
 range_query: Returns all elements within the specified range [low, high].
 """
 
+from bisect import bisect_left, bisect_right
 from typing import List
 
 
@@ -16,14 +17,14 @@ class RangeQueryProcessor:
         self.data = sorted(data)
 
     def range_query(self, low: float, high: float) -> List[float]:
-        """Return all elements within the specified range [low, high]."""
-        result = []
-        for value in self.data:
-            if low <= value <= high:
-                result.append(value)
-            elif value > high:
-                break
-        return result
+        """Return all elements within the specified range [low, high].
+
+        self.data is sorted, so both ends are found by binary search in
+        O(log n) and the answer is a single slice.
+        """
+        lo = bisect_left(self.data, low)
+        hi = bisect_right(self.data, high)
+        return self.data[lo:hi]
     
 
     
@@ -2,6 +2,10 @@
 efficient range query processing for real-time data
 Specialized in handling large datasets with optimized search algorithms
 """
+from array import array
+from itertools import accumulate
+from math import isqrt
+from operator import add
 from typing import List
 
 
@@ -13,64 +17,139 @@ functions:
 - build_fenwick_tree(data: List[float]) -> None
 - range_query_fenwick(query_start: int, query_end: int) -> float
 - real_time_update(index: int, new_value: float) -> None
+- range_query_batch(starts: List[int], ends: List[int]) -> List[float]
+- MultiRangeProcessor(series: List[List[float]]).range_query_all(query_start: int, query_end: int) -> List[float]
 
 build_segment_tree: Builds a segment tree for range sum queries.
 range_query_segment: Performs range sum query using segment tree.
 build_fenwick_tree: Builds a Fenwick Tree (Binary Indexed Tree).
 range_query_fenwick: Performs range sum query using Fenwick Tree.
 real_time_update: Updates the value at a specific index in real-time.
+range_query_batch: Answers many range sum queries at once from cached prefix sums.
+MultiRangeProcessor: Range sums over several equally long series with one shared tree walk.
 """
 
+# Segment tree kernels. They take the flat heap-indexed tree and its leaf count
+# rather than self, and use only int arithmetic and indexing. The tree stays
+# in plain heap order: the query climbs from the leaves with index arithmetic
+# only, and a cache-oblivious (van Emde Boas) order would add a permutation
+# lookup per node visited, which costs more than it saves here.
+
+def _segment_query(tree, n, query_start, query_end):
+    # Half-open leaf range [lo, hi), climbed one level per iteration;
+    # a boundary node that is a right/left child is added and stepped past
+    lo = max(query_start, 0) + n
+    hi = min(query_end, n - 1) + n + 1
+    result = 0
+    while lo < hi:
+        if lo & 1:
+            result += tree[lo]
+            lo += 1
+        if hi & 1:
+            hi -= 1
+            result += tree[hi]
+        lo >>= 1
+        hi >>= 1
+    return result
+
+def _segment_update(tree, n, update_index, new_value):
+    # Write the leaf, then recompute each ancestor from its two children
+    i = update_index + n
+    tree[i] = new_value
+    i >>= 1
+    while i:
+        tree[i] = tree[2 * i] + tree[2 * i + 1]
+        i >>= 1
+
+# Every tree node sums a subset of the values, so while the sum of their
+# magnitudes stays below this, no node can leave int64
+INT64_LIMIT = 1 << 63
+
+def _tree_storage(values, abs_sum, tree):
+    # Trees are flat typed arrays (8 bytes per node instead of a pointer to a
+    # boxed number): int64 while every value is an int and abs_sum fits, so
+    # sums stay exact ints, float64 if some value is not an int. Ints too
+    # large for int64 stay a plain list of exact Python ints
+    if not all(type(value) is int for value in values):
+        return array('d', tree)
+    if abs_sum < INT64_LIMIT:
+        return array('q', tree)
+    return tree
+
+def _widen(tree, typecode):
+    # An int64 tree copied to float64 ('d') or to a list of Python ints (None);
+    # anything else is returned as is
+    if not isinstance(tree, array) or tree.typecode != 'q':
+        return tree
+    return array(typecode, tree) if typecode else list(tree)
+
 class RangeQueryProcessorAdvanced:
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = ('data', 'segment_tree', 'fenwick_tree', '_n', '_prefix', '_pending',
+                 '_total_sum', '_abs_sum', '_min_idx', '_max_idx')
+
     def __init__(self, data=None):
         self.data = data or []
         self.segment_tree = None
         self.fenwick_tree = None
+        self._n = 0
+        # Prefix sums for range_query_batch (None until first needed) and the
+        # (index, delta) updates made since they were computed
+        self._prefix = None
+        self._pending = []
+        # Fenwick shortcuts: the sum of all values, and bounds on the first and
+        # last nonzero index (they may be loose after updates, never wrong)
+        self._total_sum = 0
+        # Sum of |value| over data, which bounds every node of an int64 tree
+        self._abs_sum = 0
+        self._min_idx = 0
+        self._max_idx = -1
 
     def build_segment_tree(self, data):
         """Build segment tree for range sum queries"""
         n = len(data)
         self.data = data
-        self.segment_tree = [0] * (4 * n)
-        self._build_segment_tree_util(0, n-1, 0)
-
-    def _build_segment_tree_util(self, start, end, index):
-        if start == end:
-            self.segment_tree[index] = self.data[start]
-            return
-        
-        mid = (start + end) // 2
-        self._build_segment_tree_util(start, mid, 2*index+1)
-        self._build_segment_tree_util(mid+1, end, 2*index+2)
-        self.segment_tree[index] = self.segment_tree[2*index+1] + self.segment_tree[2*index+2]
-
+        self._n = n
+        self._prefix = None
+        # Heap layout without recursion: leaves live at [n, 2n) and node i is
+        # the sum of nodes 2i and 2i+1. Parents are filled a band at a time:
+        # nodes [lo, hi) only read nodes [2lo, 2hi), which are all >= hi, so
+        # each band is one slice assignment from the strided children
+        tree = [0] * (2 * n)
+        tree[n:] = data
+        hi = n
+        while hi > 1:
+            lo = (hi + 1) // 2
+            tree[lo:hi] = map(add, tree[2 * lo:2 * hi:2], tree[2 * lo + 1:2 * hi:2])
+            hi = lo
+        self._abs_sum = sum(map(abs, data))
+        self.segment_tree = _tree_storage(data, self._abs_sum, tree)
 
     def range_query_segment(self, query_start, query_end):
         """Range sum query using segment tree"""
-        return self._range_query_util(0, len(self.data)-1, query_start, query_end, 0)
-
-    def _range_query_util(self, segment_start, segment_end, query_start, query_end, index):
-        if query_start <= segment_start and query_end >= segment_end:
-            return self.segment_tree[index]
-        
-        if query_end < segment_start or query_start > segment_end:
-            return 0
-        
-        mid = (segment_start + segment_end) // 2
-        left_sum = self._range_query_util(segment_start, mid, query_start, query_end, 2*index+1)
-        right_sum = self._range_query_util(mid+1, segment_end, query_start, query_end, 2*index+2)
-        return left_sum + right_sum
+        return _segment_query(self.segment_tree, self._n, query_start, query_end)
 
     def build_fenwick_tree(self, data):
         """Build Fenwick Tree (Binary Indexed Tree)"""
         n = len(data)
         self.data = data
-        self.fenwick_tree = [0] * (n + 1)
-        
-        for i in range(n):
-            self._fenwick_update(i, data[i])
+        self._prefix = None
+        # Linear build: start from the raw values, then push each node's
+        # total into its parent i + (i & -i) once, in increasing order
+        tree = [0] * (n + 1)
+        tree[1:] = data
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self._abs_sum = sum(map(abs, data))
+        self.fenwick_tree = _tree_storage(data, self._abs_sum, tree)
+        self._total_sum = sum(data)
+        self._min_idx = next((i for i, value in enumerate(data) if value), n)
+        self._max_idx = next((i for i in range(n - 1, -1, -1) if data[i]), -1)
 
     def _fenwick_update(self, index, value):
+        self._total_sum += value
         index += 1
         while index <= len(self.data):
             self.fenwick_tree[index] += value
@@ -78,17 +157,39 @@ class RangeQueryProcessorAdvanced:
 
     def range_query_fenwick(self, query_start, query_end):
         """Range sum query using Fenwick Tree"""
-        if query_start == 0:
-            return self._fenwick_prefix_sum(query_end)
-        return self._fenwick_prefix_sum(query_end) - self._fenwick_prefix_sum(query_start - 1)
+        if query_start <= query_end:
+            # Ranges holding every nonzero value, or none of them, need no walk
+            if query_end < self._min_idx or query_start > self._max_idx:
+                return 0
+            if query_start <= self._min_idx and query_end >= self._max_idx:
+                return self._total_sum
+        # prefix(hi) - prefix(lo) in one walk: both indices drop their lowest
+        # set bit towards their common prefix, and the shared part of the two
+        # walks is never visited
+        tree = self.fenwick_tree
+        lo = max(query_start, 0)
+        hi = query_end + 1
+        result = 0
+        while hi != lo:
+            if hi > lo:
+                result += tree[hi]
+                hi &= hi - 1
+            else:
+                result -= tree[lo]
+                lo &= lo - 1
+        return result
 
     def _fenwick_prefix_sum(self, index):
         """Calculate prefix sum [0..index]"""
+        if index < self._min_idx:
+            return 0
+        if index >= self._max_idx:
+            return self._total_sum
         index += 1
         result = 0
         while index > 0:
             result += self.fenwick_tree[index]
-            index -= index & -index
+            index &= index - 1  # drop the lowest set bit
         return result
 
     def real_time_update(self, index, new_value):
@@ -97,25 +198,110 @@ class RangeQueryProcessorAdvanced:
             return
         
         old_value = self.data[index]
+        abs_sum = self._abs_sum - abs(old_value) + abs(new_value)
+
+        # Move int64 trees to storage that can hold the new value before
+        # anything is written: float64 for a non-int value, exact Python
+        # ints once the sums could leave int64
+        if type(new_value) is not int:
+            self.segment_tree = _widen(self.segment_tree, 'd')
+            self.fenwick_tree = _widen(self.fenwick_tree, 'd')
+        elif abs_sum >= INT64_LIMIT:
+            self.segment_tree = _widen(self.segment_tree, None)
+            self.fenwick_tree = _widen(self.fenwick_tree, None)
+        
         self.data[index] = new_value
+        self._abs_sum = abs_sum
         
         # Update segment tree
         if self.segment_tree:
-            self._segment_tree_update(0, len(self.data)-1, index, new_value - old_value, 0)
+            _segment_update(self.segment_tree, self._n, index, new_value)
         
         # Update Fenwick tree
         if self.fenwick_tree:
             self._fenwick_update(index, new_value - old_value)
+            if new_value:
+                self._min_idx = min(self._min_idx, index)
+                self._max_idx = max(self._max_idx, index)
 
-    def _segment_tree_update(self, segment_start, segment_end, update_index, diff, tree_index):
-        if update_index < segment_start or update_index > segment_end:
-            return
-        
-        self.segment_tree[tree_index] += diff
-        if segment_start != segment_end:
-            mid = (segment_start + segment_end) // 2
-            self._segment_tree_update(segment_start, mid, update_index, diff, 2*tree_index+1)
-            self._segment_tree_update(mid+1, segment_end, update_index, diff, 2*tree_index+2)
+        # Prefix sums: remember the delta, recompute once more than sqrt(n) pile up
+        if self._prefix is not None:
+            self._pending.append((index, new_value - old_value))
+            if len(self._pending) > isqrt(len(self.data)):
+                self._prefix = None
+
+    def range_query_batch(self, starts, ends):
+        """Range sum queries [starts[k]..ends[k]] answered together from prefix sums"""
+        if self._prefix is None:
+            self._prefix = [0, *accumulate(self.data)]
+            self._pending = []
+        prefix = self._prefix
+        results = [prefix[end + 1] - prefix[start] for start, end in zip(starts, ends)]
+        # Fold in the updates made since the prefix sums were computed
+        for index, delta in self._pending:
+            for k, (start, end) in enumerate(zip(starts, ends)):
+                if start <= index <= end:
+                    results[k] += delta
+        return results
+
+class MultiRangeProcessor:
+    """Segment tree shared by several series of the same length.
+
+    Node i of the heap layout keeps one sum per series, stored together at
+    tree[i * k:(i + 1) * k] for k series. A range query walks the tree once,
+    exactly like range_query_segment, and adds whole per-node blocks, so the
+    k answers cost one O(log n) walk instead of k separate ones.
+    """
+    __slots__ = ('num_series', '_n', 'tree')
+
+    def __init__(self, series: List[List[float]]):
+        k = len(series)
+        n = len(series[0]) if series else 0
+        self.num_series = k
+        self._n = n
+        tree = [0] * (2 * n * k)
+        # Leaf j of series s sits at (n + j) * k + s
+        for s, values in enumerate(series):
+            tree[n * k + s::k] = values
+        # Parent bands as in build_segment_tree, one strided slice per series
+        hi = n
+        while hi > 1:
+            lo = (hi + 1) // 2
+            for s in range(k):
+                tree[lo * k + s:hi * k:k] = map(add, tree[2 * lo * k + s:2 * hi * k:2 * k],
+                                                tree[(2 * lo + 1) * k + s:2 * hi * k:2 * k])
+            hi = lo
+        self.tree = tree
+
+    def range_query_all(self, query_start, query_end):
+        """Sum of [query_start..query_end] in every series"""
+        n = self._n
+        k = self.num_series
+        tree = self.tree
+        lo = max(query_start, 0) + n
+        hi = min(query_end, n - 1) + n + 1
+        result = [0] * k
+        while lo < hi:
+            if lo & 1:
+                result = list(map(add, result, tree[lo * k:(lo + 1) * k]))
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                result = list(map(add, result, tree[hi * k:(hi + 1) * k]))
+            lo >>= 1
+            hi >>= 1
+        return result
+
+    def update(self, series_index, index, new_value):
+        """Set one value of one series and refresh its column up the tree"""
+        k = self.num_series
+        tree = self.tree
+        i = index + self._n
+        tree[i * k + series_index] = new_value
+        i >>= 1
+        while i:
+            tree[i * k + series_index] = tree[2 * i * k + series_index] + tree[(2 * i + 1) * k + series_index]
+            i >>= 1
 
 # Example usage:
 if __name__ == "__main__":
@@ -134,4 +320,11 @@ if __name__ == "__main__":
     processor.real_time_update(3, 10)  # Update index 3 from 7 to 10
     print("After Update - Segment Tree Range Query (1-4):", processor.range_query_segment(1, 4))  # Output: 27
     print("After Update - Fenwick Tree Range Query (1-4):", processor.range_query_fenwick(1, 4))  # Output: 27
+
+    # Batched queries
+    print("Batch Range Queries (0-2, 1-4, 3-5):", processor.range_query_batch([0, 1, 3], [2, 4, 5]))  # Output: [9, 27, 30]
+
+    # Several series at once
+    multi = MultiRangeProcessor([data, [2, 4, 6, 8, 10, 12]])
+    print("Multi-Series Range Query (1-4):", multi.range_query_all(1, 4))  # Output: [27, 28]
     
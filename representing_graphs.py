@@ -2,12 +2,20 @@
 
 # This code defines a simple undirected graph using an adjacency list representation.
 
+from array import array
+from typing import List
+
 class Graph:
     # Initializing the graph with an empty adjacency list
     def __init__(self, num_nodes: int = 0) -> None:
         self.adjacency_list = {}
         self.num_edges = 0
         self.num_nodes = num_nodes
+        # CSR view (see finalize), built lazily and dropped whenever an edge is added
+        self.labels = None
+        self.index_of = None
+        self.indptr = None
+        self.indices = None
 
     # Method to add an edge between two nodes
     """
@@ -27,6 +35,34 @@ class Graph:
         self.adjacency_list[u].append(v)
         self.adjacency_list[v].append(u)  # For undirected graph
         self.num_edges += 1
+        self.indptr = None  # CSR view is stale
+
+    """
+    Freezes the current edges into compressed sparse row (CSR) arrays. Nodes get
+    compact ids 0..V-1 in insertion order (labels[i] is the node with id i,
+    index_of maps back), and the neighbour ids of id i are
+    indices[indptr[i]:indptr[i + 1]], stored contiguously in int arrays.
+    """
+    def finalize(self) -> None:
+        labels = list(self.adjacency_list)
+        index_of = {node: i for i, node in enumerate(labels)}
+        indptr = array('i', [0])
+        indices = array('i')
+        for node in labels:
+            indices.extend(index_of[v] for v in self.adjacency_list[node])
+            indptr.append(len(indices))
+        self.labels = labels
+        self.index_of = index_of
+        self.indptr = indptr
+        self.indices = indices
+
+    # Neighbours of a node, read from the CSR arrays (built on first use)
+    def neighbors(self, u: int) -> List[int]:
+        if self.indptr is None:
+            self.finalize()
+        i = self.index_of[u]
+        labels = self.labels
+        return [labels[v] for v in self.indices[self.indptr[i]:self.indptr[i + 1]]]
 
     def display(self) -> None:
         print("Graph adjacency list:")
@@ -36,12 +72,19 @@ class Graph:
 
 # Alternative representation using adjacency matrix
 class GraphMatrix:
-    # Initializing the graph with a given size and creating an adjacency matrix
+    # Initializing the graph with a given size. Each matrix row is stored as one
+    # int used as a bitset (bit v of rows[u] is set when u and v are adjacent),
+    # so a row costs size bits instead of size boxed ints
     def __init__(self, size: int) -> None:
         self.size = size
-        self.adjacency_matrix = [[0 for _ in range(size)] for _ in range(size)]
+        self.rows = [0] * size
         self.num_edges = 0
 
+    # The matrix as rows of 0/1 values, unpacked from the bitsets
+    @property
+    def adjacency_matrix(self) -> List[List[int]]:
+        return [[row >> v & 1 for v in range(self.size)] for row in self.rows]
+
     # Method to add an edge between two nodes
     """
     Adds an undirected edge between nodes u and v by updating the adjacency matrix. The method also increments the edge count.
@@ -50,12 +93,25 @@ class GraphMatrix:
     v (int): The second node.
     """
     def add_edge(self, u: int, v: int) -> None:
-        if u >= self.size or v >= self.size:
+        if u >= self.size or v >= self.size or u < 0 or v < 0:
             raise ValueError("Node index out of bounds")
-        self.adjacency_matrix[u][v] = 1
-        self.adjacency_matrix[v][u] = 1  # For undirected graph
+        self.rows[u] |= 1 << v
+        self.rows[v] |= 1 << u  # For undirected graph
         self.num_edges += 1
 
+    def has_edge(self, u: int, v: int) -> bool:
+        return bool(self.rows[u] >> v & 1)
+
+    # Neighbours of u, read off the set bits of its row lowest first
+    def neighbors(self, u: int) -> List[int]:
+        result = []
+        row = self.rows[u]
+        while row:
+            bit = row & -row
+            result.append(bit.bit_length() - 1)
+            row ^= bit
+        return result
+
     def display(self) -> None:
         print("Graph adjacency matrix:")
         for row in self.adjacency_matrix:
@@ -71,10 +127,12 @@ if __name__ == "__main__":
     g.add_edge(2, 4)
     g.add_edge(3, 4)
     g.display()
+    print("Neighbours of 1:", g.neighbors(1))
 
     gm = GraphMatrix(5)
     gm.add_edge(0, 1)
     gm.add_edge(0, 2)
     gm.add_edge(1, 3)
     gm.add_edge(2, 3)
-    gm.display()
\ No newline at end of file
+    gm.display()
+    print("Neighbours of 0:", gm.neighbors(0))
\ No newline at end of file
@@ -12,9 +12,182 @@ the algorithm is often efficient, but its worst case time complexity is still $O
 where $n$ is the number of nodes and $m$ is the number of edges, and it is possible to create inputs that make the algorithm as slow as the original
 Bellman–Ford algorithm.
 """
-from collections import deque
+from array import array
+from functools import lru_cache
 from typing import Dict, List, Tuple    
 
+# Dial's buckets are used only while the largest possible distance, about
+# max_weight * num_nodes, stays below this many empty-bucket steps
+DIAL_MAX_SPAN = 1 << 22
+
+# Ints in [-INT64_LIMIT, INT64_LIMIT) fit an int64 ('q') array
+INT64_LIMIT = 1 << 63
+
+# Hashable graph snapshot made by freeze_graph: ((node, ((v, w), ...)), ...)
+FrozenGraph = Tuple[Tuple[int, Tuple[Tuple[int, float], ...]], ...]
+
+def _to_csr(graph: Dict[int, List[Tuple[int, float]]],
+            weight_type: str = 'd') -> Tuple[List[int], Dict[int, int], array, array, array]:
+    """
+    Flatten an adjacency dict into CSR arrays over compact node ids.
+
+    Returns (labels, index_of, indptr, targets, weights): labels[i] is the node
+    with id i, and the edges leaving id u are targets/weights[indptr[u]:indptr[u + 1]].
+    Nodes that only appear as edge targets get ids after the graph's keys.
+    weight_type is the array typecode for weights ('d' float64, 'q' int64).
+    """
+    labels: List[int] = list(graph)
+    index_of: Dict[int, int] = {node: i for i, node in enumerate(labels)}
+    indptr = array('i', [0])
+    targets = array('i')
+    weights = array(weight_type)
+    for edges in graph.values():
+        for v, weight in edges:
+            v_index = index_of.get(v)
+            if v_index is None:
+                v_index = index_of[v] = len(labels)
+                labels.append(v)
+            targets.append(v_index)
+            weights.append(weight)
+        indptr.append(len(targets))
+    indptr.extend([len(targets)] * (len(labels) - len(graph)))
+    return labels, index_of, indptr, targets, weights
+
+def _spfa_csr(indptr: array, targets: array, weights: array, distances: array, source: int,
+              queue: array, in_queue: bytearray, hops: array) -> bool:
+    """SPFA (with SLF/LLL) over CSR arrays, updating distances in place.
+
+    distances must hold inf everywhere except 0.0 at source; queue, in_queue
+    and hops are zeroed work buffers of one slot per node, supplied by the
+    caller so the loop itself allocates nothing. Returns True if a
+    negative-weight cycle is reachable from source (distances are then partial)
+    rather than raising. The queue is a ring buffer, not a deque.
+    """
+    num_nodes = len(distances)
+    # Queue for processing nodes: a ring buffer of num_nodes slots (a node is
+    # never queued twice), live from head for count entries. SLF (Smallest Label
+    # First): a node whose new distance beats the front is pushed at the front
+    # instead of the back. LLL (Large Label Last): before popping, fronts heavier
+    # than the queue's average distance are rotated to the back. queue_sum
+    # tracks the total distance of queued nodes for that average.
+    queue[0] = source
+    head = 0
+    count = 1
+    in_queue[source] = 1
+    queue_sum = 0.0
+
+    while count:
+        for _ in range(count - 1):
+            front = queue[head]
+            if distances[front] * count <= queue_sum:
+                break
+            # Rotate: the slot after the back is the one head is leaving
+            tail = head + count
+            if tail >= num_nodes:
+                tail -= num_nodes
+            queue[tail] = front
+            head += 1
+            if head == num_nodes:
+                head = 0
+
+        u = queue[head]
+        head += 1
+        if head == num_nodes:
+            head = 0
+        count -= 1
+        in_queue[u] = 0
+        du = distances[u]
+        queue_sum -= du
+
+        for pos in range(indptr[u], indptr[u + 1]):
+            v = targets[pos]
+            new_distance = du + weights[pos]
+            if new_distance < distances[v]:
+                if in_queue[v]:
+                    queue_sum += new_distance - distances[v]
+                distances[v] = new_distance
+                hops[v] = hops[u] + 1
+                if hops[v] >= num_nodes:
+                    return True
+                if not in_queue[v]:
+                    if count and new_distance < distances[queue[head]]:
+                        head -= 1
+                        if head < 0:
+                            head = num_nodes - 1
+                        queue[head] = v
+                    else:
+                        tail = head + count
+                        if tail >= num_nodes:
+                            tail -= num_nodes
+                        queue[tail] = v
+                    count += 1
+                    in_queue[v] = 1
+                    queue_sum += new_distance
+
+    return False
+
+def _dial_csr(indptr: array, targets: array, weights: array, distances: array,
+              source: int, max_weight: int) -> None:
+    """Dial's algorithm over CSR arrays with integer weights in [0, max_weight].
+
+    Nodes wait in buckets indexed by their tentative distance; buckets are
+    drained in increasing distance, so each node is settled the first time it
+    is popped with its current distance. Any tentative distance is within
+    max_weight of the one being drained, so max_weight + 1 buckets are reused
+    circularly. Stale entries (the node has since improved) are skipped.
+    """
+    num_buckets = max_weight + 1
+    buckets: List[List[int]] = [[] for _ in range(num_buckets)]
+    buckets[0].append(source)
+    pending = 1
+    distance = 0
+    while pending:
+        bucket = buckets[distance % num_buckets]
+        while bucket:
+            u = bucket.pop()
+            pending -= 1
+            if distances[u] != distance:
+                continue
+            for pos in range(indptr[u], indptr[u + 1]):
+                v = targets[pos]
+                new_distance = distance + weights[pos]
+                if new_distance < distances[v]:
+                    distances[v] = new_distance
+                    buckets[new_distance % num_buckets].append(v)
+                    pending += 1
+        distance += 1
+
+def _spfa(graph: Dict[int, List[Tuple[int, float]]], start_node: int) -> Dict[int, float]:
+    """spfa itself, shared by the plain and the memoised entry points."""
+    # int64 weights only when every weight is an int that fits; anything else
+    # (floats, or ints of 2**63 and beyond) is stored as float64
+    integral = all(type(weight) is int and -INT64_LIMIT <= weight < INT64_LIMIT
+                   for edges in graph.values() for _, weight in edges)
+    labels, index_of, indptr, targets, weights = _to_csr(graph, 'q' if integral else 'd')
+
+    if start_node not in index_of:
+        raise ValueError(f"start_node {start_node} is not present in graph")
+
+    # Initialize distances from start_node to all other nodes as infinite
+    source = index_of[start_node]
+    distances = array('d', [float('inf')]) * len(labels)
+    distances[source] = 0.0
+
+    # Small non-negative integer weights: bucket queue, every node settled once
+    if integral and weights and min(weights) >= 0 and max(weights) * len(labels) <= DIAL_MAX_SPAN:
+        _dial_csr(indptr, targets, weights, distances, source, max(weights))
+    else:
+        num_nodes = len(labels)
+        queue = array('i', bytes(4 * num_nodes))
+        # Edges on the current best path to each node: a simple path has at
+        # most n-1 edges, so reaching n proves a negative-weight cycle. Unlike
+        # counting relaxations, this stays valid when SLF/LLL reorder the queue.
+        hops = array('i', bytes(4 * num_nodes))
+        if _spfa_csr(indptr, targets, weights, distances, source, queue, bytearray(num_nodes), hops):
+            raise ValueError("Negative weight cycle detected")
+
+    return dict(zip(labels, distances))
+
 def spfa(graph: Dict[int, List[Tuple[int, float]]], start_node: int) -> Dict[int, float]:
     """Perform the SPFA algorithm to find shortest paths from start_node.
     
@@ -22,45 +195,35 @@ def spfa(graph: Dict[int, List[Tuple[int, float]]], start_node: int) -> Dict[int
     param start_node: int: The node from which to start the shortest path calculations.
     Returns a dictionary with the shortest distance to each node from start_node.
     Raises a ValueError if a negative weight cycle is detected.
+
+    The graph is flattened once into CSR arrays over compact node ids, so the
+    search itself indexes flat arrays instead of hashing nodes into dicts.
+    When every weight is a small non-negative int, Dial's bucket queue is used
+    instead of the SPFA queue. For repeated queries on a graph that will not
+    change, see freeze_graph and spfa_frozen.
     """
-    # Collect all nodes (keys and any nodes that appear as edge targets)
-    nodes = set(graph.keys())
-    for u, edges in graph.items():
-        for v, _ in edges:
-            nodes.add(v)
+    return _spfa(graph, start_node)
 
-    if start_node not in nodes:
-        raise ValueError(f"start_node {start_node} is not present in graph")
+def freeze_graph(graph: Dict[int, List[Tuple[int, float]]]) -> FrozenGraph:
+    """Hashable snapshot of an adjacency dict, for spfa_frozen.
 
-    # Initialize distances from start_node to all other nodes as infinite
-    distances = {node: float('inf') for node in nodes}
-    distances[start_node] = 0.0
-
-    # Queue for processing nodes
-    queue = deque([start_node])
-    in_queue = {node: False for node in nodes}
-    in_queue[start_node] = True
-
-    # Count relaxations per node to detect negative-weight cycles
-    relax_count = {node: 0 for node in nodes}
-    max_relax = max(0, len(nodes) - 1)
-
-    while queue:
-        u = queue.popleft()
-        in_queue[u] = False
-
-        for v, weight in graph.get(u, []):
-            if distances[u] + weight < distances[v]:
-                distances[v] = distances[u] + weight
-                relax_count[v] += 1
-                if relax_count[v] > max_relax:
-                    # A vertex was relaxed more than n-1 times -> negative cycle
-                    raise ValueError("Negative weight cycle detected")
-                if not in_queue[v]:
-                    queue.append(v)
-                    in_queue[v] = True
+    Edges may be tuples or lists; both become tuples.
+    """
+    return tuple((node, tuple(map(tuple, edges))) for node, edges in graph.items())
+
+@lru_cache(maxsize=16)
+def _spfa_memo(frozen_graph: FrozenGraph, start_node: int) -> Dict[int, float]:
+    return _spfa(dict(frozen_graph), start_node)
 
-    return distances
+def spfa_frozen(frozen_graph: FrozenGraph, start_node: int) -> Dict[int, float]:
+    """spfa on a snapshot from freeze_graph, memoised per (snapshot, start_node).
+
+    Opt-in caching for callers that query one unchanging graph repeatedly:
+    freeze it once and pass the snapshot. A hit still hashes the snapshot,
+    O(E), but skips the search. The 16 most recent results are kept;
+    negative cycles raise and are not cached.
+    """
+    return dict(_spfa_memo(frozen_graph, start_node))
 
 # Example usage
 if __name__ == "__main__":
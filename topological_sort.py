@@ -3,42 +3,176 @@ Topological Sort for Directed Acyclic Graphs (DAG)
 
 """
 
-from collections import deque
-from typing import Dict, List, Set, Optional, Deque
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heapify, heappop, heappush
+from itertools import accumulate, chain
+from operator import eq
+from typing import Dict, List, Optional, Iterator, Tuple
+
+
+def _is_dense(graph: Dict[int, List[int]]) -> bool:
+    """True if the keys are exactly 0..n-1, in that order."""
+    return all(map(eq, graph, range(len(graph))))
+
+
+def _to_csr(graph: Dict[int, List[int]]) -> Tuple[array, array, Optional[List[int]]]:
+    """
+    Flatten an adjacency dict into CSR arrays over compact vertex ids 0..n-1.
+
+    Returns (indptr, indices, idx_to_id): the successors of id u are
+    indices[indptr[u]:indptr[u + 1]]. Keys are numbered in graph order, then
+    vertices that only appear as successors in order of first appearance.
+    idx_to_id is None when the graph is keyed 0..n-1 and every successor is
+    a key, i.e. the vertices already are their own ids; that common shape is
+    flattened in C-level passes with no id mapping at all.
+    """
+    if _is_dense(graph):
+        n = len(graph)
+        try:
+            indices = array('i', chain.from_iterable(graph.values()))
+        except (TypeError, OverflowError):
+            indices = None
+        if indices is not None and (not indices or (min(indices) >= 0 and max(indices) < n)):
+            indptr = array('i', [0])
+            indptr.extend(accumulate(map(len, graph.values())))
+            return indptr, indices, None
+    
+    idx_to_id: List[int] = list(graph)
+    id_to_idx: Dict[int, int] = {v: i for i, v in enumerate(idx_to_id)}
+    indptr = array('i', [0])
+    indices = array('i')
+    lookup = id_to_idx.__getitem__
+    for neighbors in graph.values():
+        try:
+            indices.extend(map(lookup, neighbors))
+        except KeyError:
+            # Some successor is new: number it, then redo this list
+            del indices[indptr[-1]:]
+            for v in neighbors:
+                if v not in id_to_idx:
+                    id_to_idx[v] = len(idx_to_id)
+                    idx_to_id.append(v)
+            indices.extend(map(lookup, neighbors))
+        indptr.append(len(indices))
+    indptr.extend([len(indices)] * (len(idx_to_id) - len(graph)))
+    return indptr, indices, idx_to_id
+
+
+def _unvisited(graph: Dict[int, List[int]]) -> Dict[int, int]:
+    """
+    Map every vertex (keys first, then successors in order of appearance) to 0.
+
+    One pass over the keys and edge lists registers the vertices and builds
+    the DFS state table together, instead of a vertex set and then a dict.
+    """
+    return dict.fromkeys(chain(graph, chain.from_iterable(graph.values())), 0)
+
+
+def _kahn_csr(indptr: array, indices: array, in_degree: List[int]) -> Tuple[List[int], int]:
+    """
+    Kahn's algorithm over CSR arrays; in_degree is consumed in place.
+
+    Returns (order, count): order[:count] is the topological order, and
+    count < n means a cycle kept some vertices from reaching in-degree 0.
+    The order buffer doubles as the BFS queue (vertices are dequeued from
+    head and appended at count).
+    """
+    n = len(in_degree)
+    order = [0] * n
+    count = 0
+    # Initialize queue with vertices having in-degree 0
+    for v in range(n):
+        if in_degree[v] == 0:
+            order[count] = v
+            count += 1
+    
+    head = 0
+    while head < count:
+        u = order[head]
+        head += 1
+        # Reduce in-degree for neighbors
+        for v in indices[indptr[u]:indptr[u + 1]]:
+            in_degree[v] -= 1
+            if in_degree[v] == 0:
+                order[count] = v
+                count += 1
+    return order, count
 
 
 def topological_sort_kahn(graph: Dict[int, List[int]]) -> Optional[List[int]]:
     """
     Perform topological sort using Kahn's algorithm (BFS-based).
+
+    The graph is flattened once into CSR arrays over compact vertex ids, so
+    in-degrees are indexed by id and the BFS (_kahn_csr) walks contiguous
+    slices instead of hashing vertices into dicts.
     """
-    # Collect all vertices
-    vertices: Set[int] = set(graph.keys())
-    for neighbors in graph.values():
-        vertices.update(neighbors)
+    indptr, indices, idx_to_id = _to_csr(graph)
+    n = len(indptr) - 1
     
-    # Calculate in-degrees
-    in_degree: Dict[int, int] = {v: 0 for v in vertices}
-    for u in graph:
-        for v in graph[u]:
-            in_degree[v] += 1
+    # Calculate in-degrees (a dense list by vertex id; list items are read
+    # and written back faster than an int array's, which re-box every value)
+    in_degree: List[int] = [0] * n
+    for v in indices:
+        in_degree[v] += 1
     
-    # Initialize queue with vertices having in-degree 0
-    queue: Deque[int] = deque([v for v in vertices if in_degree[v] == 0])
-    topo_order: List[int] = []
+    order, count = _kahn_csr(indptr, indices, in_degree)
     
-    while queue:
-        u: int = queue.popleft()
-        topo_order.append(u)
-        
-        # Reduce in-degree for neighbors
-        for v in graph.get(u, []):
+    # Check if all vertices were processed (no cycle)
+    if count == n:
+        return order if idx_to_id is None else [idx_to_id[u] for u in order]
+    else:
+        return None  # Cycle detected
+
+
+def topological_sort_kahn_or_none(graph: Dict[int, List[int]]) -> Tuple[Optional[List[int]], bool]:
+    """
+    Kahn's sort that also reports whether a cycle was found: (order, had_cycle).
+
+    One BFS settles both questions, so a caller that needs the order and the
+    cycle verdict does not follow the sort with a separate has_cycle walk.
+    order is None exactly when had_cycle is True.
+    """
+    order = topological_sort_kahn(graph)
+    return order, order is None
+
+
+def topological_sort_kahn_priority(graph: Dict[int, List[int]], priority: Dict[int, float]) -> Optional[List[int]]:
+    """
+    Kahn's algorithm that always takes the ready vertex of lowest priority.
+
+    The FIFO queue is replaced by a heap of (priority, id), so among the
+    vertices whose prerequisites are all placed the one with the smallest
+    priority[v] comes next (ties go to graph order). The result is the same
+    for any ordering of the graph's edge lists. O((V + E) log V).
+
+    Raises:
+        KeyError: If some vertex has no entry in priority
+    """
+    indptr, indices, idx_to_id = _to_csr(graph)
+    n = len(indptr) - 1
+    labels = range(n) if idx_to_id is None else idx_to_id
+    key = [priority[v] for v in labels]
+    
+    in_degree: List[int] = [0] * n
+    for v in indices:
+        in_degree[v] += 1
+    
+    heap = [(key[v], v) for v in range(n) if in_degree[v] == 0]
+    heapify(heap)
+    order: List[int] = []
+    while heap:
+        u = heappop(heap)[1]
+        order.append(labels[u])
+        for v in indices[indptr[u]:indptr[u + 1]]:
             in_degree[v] -= 1
             if in_degree[v] == 0:
-                queue.append(v)
+                heappush(heap, (key[v], v))
     
     # Check if all vertices were processed (no cycle)
-    if len(topo_order) == len(vertices):
-        return topo_order
+    if len(order) == n:
+        return order
     else:
         return None  # Cycle detected
 
@@ -49,43 +183,31 @@ def topological_sort_dfs(graph: Dict[int, List[int]]) -> Optional[List[int]]:
     
 
     """
-    # Collect all vertices
-    vertices: Set[int] = set(graph.keys())
-    for neighbors in graph.values():
-        vertices.update(neighbors)
-    
     # States: 0 = unvisited, 1 = visiting, 2 = visited
-    state: Dict[int, int] = {v: 0 for v in vertices}
+    state = _unvisited(graph)
     topo_order: List[int] = []
-    has_cycle: bool = False
-    
-    def dfs(u: int) -> None:
-        nonlocal has_cycle
-        
-        if has_cycle:
-            return
-        
-        if state[u] == 1:  # Back edge found = cycle
-            has_cycle = True
-            return
-        
-        if state[u] == 2:  # Already processed
-            return
-        
-        state[u] = 1  # Mark as visiting
-        
-        for v in graph.get(u, []):
-            dfs(v)
-        
-        state[u] = 2  # Mark as visited
-        topo_order.append(u)  # Post-order: add after all descendants
     
-    # Process all vertices
-    for vertex in vertices:
-        if state[vertex] == 0:
-            dfs(vertex)
-            if has_cycle:
-                return None
+    # Process all vertices. The DFS keeps an explicit stack of (vertex,
+    # iterator over its neighbors) instead of recursing, so deep graphs do not
+    # hit the recursion limit; each iterator resumes where it left off.
+    for vertex in state:
+        if state[vertex] != 0:
+            continue
+        state[vertex] = 1  # Mark as visiting
+        stack: List[Tuple[int, Iterator[int]]] = [(vertex, iter(graph.get(vertex, [])))]
+        while stack:
+            u, neighbors = stack[-1]
+            for v in neighbors:
+                if state[v] == 1:  # Back edge found = cycle
+                    return None
+                if state[v] == 0:
+                    state[v] = 1
+                    stack.append((v, iter(graph.get(v, []))))
+                    break
+            else:
+                stack.pop()
+                state[u] = 2  # Mark as visited
+                topo_order.append(u)  # Post-order: add after all descendants
     
     # Reverse to get correct topological order
     topo_order.reverse()
@@ -98,83 +220,211 @@ def has_cycle(graph: Dict[int, List[int]]) -> bool:
     
 
     """
-    vertices: Set[int] = set(graph.keys())
-    for neighbors in graph.values():
-        vertices.update(neighbors)
-    
     # States: 0 = unvisited, 1 = visiting, 2 = visited
-    state: Dict[int, int] = {v: 0 for v in vertices}
+    state = _unvisited(graph)
+    
+    # Check all components with the same iterative DFS as topological_sort_dfs
+    for vertex in state:
+        if state[vertex] != 0:
+            continue
+        state[vertex] = 1  # Mark as visiting
+        stack: List[Tuple[int, Iterator[int]]] = [(vertex, iter(graph.get(vertex, [])))]
+        while stack:
+            u, neighbors = stack[-1]
+            for v in neighbors:
+                if state[v] == 1:  # Back edge = cycle
+                    return True
+                if state[v] == 0:
+                    state[v] = 1
+                    stack.append((v, iter(graph.get(v, []))))
+                    break
+            else:
+                stack.pop()
+                state[u] = 2  # Mark as visited
     
-    def dfs(u: int) -> bool:
-        if state[u] == 1:  # Back edge = cycle
-            return True
-        if state[u] == 2:  # Already processed
-            return False
-        
-        state[u] = 1  # Mark as visiting
-        
-        for v in graph.get(u, []):
-            if dfs(v):
-                return True
-        
-        state[u] = 2  # Mark as visited
-        return False
-    
-    # Check all components
-    for vertex in vertices:
-        if state[vertex] == 0:
-            if dfs(vertex):
+    return False
+
+
+def has_cycle_decycler(graph: Dict[int, List[int]], start: int) -> bool:
+    """
+    Check whether a cycle is reachable from start, without a state table.
+
+    The DFS keeps no visited set, only its current path, plus a "tortoise":
+    a vertex on that path which is moved down to the newest vertex whenever
+    the path grows to twice its depth (Brent's scheme). Meeting the tortoise
+    again closes a cycle. A path through more than len(graph) vertices that
+    all have successors must repeat one, so the depth also bounds the search.
+
+    Memory is O(longest path) instead of O(V), but without a visited set
+    shared descendants are re-explored, so this suits trees and reference
+    chains hanging off one root; on DAGs with many shared descendants it can
+    take exponential time, and has_cycle is the general-purpose check.
+    """
+    limit = len(graph)
+    stack: List[Tuple[int, Iterator[int]]] = [(start, iter(graph.get(start, [])))]
+    tortoise, tortoise_depth = start, 1
+    while stack:
+        for v in stack[-1][1]:
+            if v == tortoise or len(stack) > limit:
                 return True
-    
+            stack.append((v, iter(graph.get(v, []))))
+            if len(stack) >= 2 * tortoise_depth:
+                tortoise, tortoise_depth = v, len(stack)
+            break
+        else:
+            stack.pop()
+            if len(stack) < tortoise_depth and stack:
+                # The tortoise left the path: restart it at the root
+                tortoise, tortoise_depth = start, 1
     return False
 
 
-def all_topological_sorts(graph: Dict[int, List[int]]) -> List[List[int]]:
- 
-    
-    vertices: Set[int] = set(graph.keys())
-    for neighbors in graph.values():
-        vertices.update(neighbors)
+def _enumeration_state(graph: Dict[int, List[int]]) -> Optional[Tuple[Optional[List[int]], List[int], List[Tuple[int, ...]]]]:
+    """
+    Shared setup for enumerating and counting orderings.
+
+    Returns (idx_to_id, in_degree, adj) over compact ids 0..n-1, with
+    idx_to_id as from _to_csr: in_degree is a list and adj[u] a tuple of
+    successor ids, so the backtracking does no dict lookups. Returns None if
+    the graph has a cycle: one Kahn pass settles that in O(V + E), whereas
+    the backtracking would only find out after trying every prefix that
+    stops short of the cycle.
+    """
+    indptr, indices, idx_to_id = _to_csr(graph)
+    n = len(indptr) - 1
     
     # Calculate in-degrees
-    in_degree: Dict[int, int] = {v: 0 for v in vertices}
-    for u in graph:
-        for v in graph[u]:
-            in_degree[v] += 1
+    in_degree: List[int] = [0] * n
+    for v in indices:
+        in_degree[v] += 1
     
-    result: List[List[int]] = []
+    if _kahn_csr(indptr, indices, in_degree[:])[1] != n:
+        return None  # Cycle: no orderings at all
+    
+    adj = [tuple(indices[indptr[u]:indptr[u + 1]]) for u in range(n)]
+    return idx_to_id, in_degree, adj
+
+
+def all_topological_sorts(graph: Dict[int, List[int]]) -> Iterator[List[int]]:
+    """
+    Enumerate every topological ordering by backtracking, one at a time.
+
+    Orderings are yielded as they are found rather than collected, so callers
+    that stop early or only look at each one need O(n) memory instead of
+    O(number of orderings * n). In-degrees and the set of already placed
+    vertices are flat arrays indexed by compact id.
+    """
+    state = _enumeration_state(graph)
+    if state is None:
+        return
+    idx_to_id, in_degree, adj = state
+    n = len(in_degree)
+    used = bytearray(n)
     current_order: List[int] = []
     
-    def backtrack() -> None:
-        if len(current_order) == len(vertices):
-            result.append(current_order[:])
+    def backtrack() -> Iterator[List[int]]:
+        if len(current_order) == n:
+            yield current_order[:] if idx_to_id is None else [idx_to_id[u] for u in current_order]
             return
         
-        # Try all vertices with in-degree 0
-        for v in vertices:
-            if in_degree[v] == 0 and v not in current_order:
+        # Try all unused vertices with in-degree 0
+        for v in range(n):
+            if in_degree[v] == 0 and not used[v]:
                 # Choose vertex v
                 current_order.append(v)
-                in_degree[v] = -1  # Mark as used
+                used[v] = 1
                 
                 # Reduce in-degrees of neighbors
-                saved_degrees: List[int] = []
-                for neighbor in graph.get(v, []):
-                    saved_degrees.append(in_degree[neighbor])
+                neighbors = adj[v]
+                for neighbor in neighbors:
                     in_degree[neighbor] -= 1
                 
                 # Recurse
-                backtrack()
+                yield from backtrack()
                 
                 # Backtrack: restore state
-                for i, neighbor in enumerate(graph.get(v, [])):
-                    in_degree[neighbor] = saved_degrees[i]
+                for neighbor in neighbors:
+                    in_degree[neighbor] += 1
                 
-                in_degree[v] = 0
+                used[v] = 0
                 current_order.pop()
     
-    backtrack()
-    return result
+    yield from backtrack()
+
+
+def all_topological_sorts_list(graph: Dict[int, List[int]]) -> List[List[int]]:
+    """Return every topological ordering as a list (all_topological_sorts, collected)."""
+    return list(all_topological_sorts(graph))
+
+
+def _count_orderings(in_degree: List[int], adj: List[Tuple[int, ...]], used: bytearray, placed: int) -> int:
+    """Count the ways to finish an ordering that already has `placed` vertices in `used`."""
+    n = len(in_degree)
+    
+    def count(placed: int) -> int:
+        if placed == n:
+            return 1
+        total = 0
+        for v in range(n):
+            if in_degree[v] == 0 and not used[v]:
+                used[v] = 1
+                neighbors = adj[v]
+                for neighbor in neighbors:
+                    in_degree[neighbor] -= 1
+                total += count(placed + 1)
+                for neighbor in neighbors:
+                    in_degree[neighbor] += 1
+                used[v] = 0
+        return total
+    
+    return count(placed)
+
+
+def _count_from_root(task: Tuple[List[int], List[Tuple[int, ...]], int]) -> int:
+    """Worker for count_topological_sorts_parallel: orderings that start with root."""
+    in_degree, adj, root = task
+    used = bytearray(len(in_degree))
+    used[root] = 1
+    for neighbor in adj[root]:
+        in_degree[neighbor] -= 1
+    return _count_orderings(in_degree, adj, used, 1)
+
+
+def count_topological_sorts(graph: Dict[int, List[int]]) -> int:
+    """
+    Count the topological orderings without building any of them.
+
+    Runs the same backtracking as all_topological_sorts, but only tracks how
+    many vertices are placed, so no ordering list is allocated or copied.
+    """
+    state = _enumeration_state(graph)
+    if state is None:
+        return 0
+    _, in_degree, adj = state
+    return _count_orderings(in_degree, adj, bytearray(len(in_degree)), 0)
+
+
+def count_topological_sorts_parallel(graph: Dict[int, List[int]], max_workers: Optional[int] = None) -> int:
+    """
+    Count the topological orderings across worker processes.
+
+    Orderings with different first vertices are disjoint, so each vertex of
+    in-degree 0 is handed to a ProcessPoolExecutor worker that counts the
+    orderings starting with it, and the counts are summed. Starting the
+    processes costs tens of milliseconds, so this only pays off for graphs
+    with very many orderings; with a single root it runs in this process.
+    """
+    state = _enumeration_state(graph)
+    if state is None:
+        return 0
+    _, in_degree, adj = state
+    n = len(in_degree)
+    roots = [v for v in range(n) if in_degree[v] == 0]
+    if len(roots) <= 1 or max_workers == 1:
+        return _count_orderings(in_degree, adj, bytearray(n), 0)
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return sum(executor.map(_count_from_root, [(in_degree, adj, root) for root in roots]))
 
 
 # Example usage
@@ -203,6 +453,10 @@ if __name__ == "__main__":
     print(f"\nValid course order (Kahn's): {kahn_order}")
     print(f"Valid course order (DFS):    {dfs_order}")
     
+    # Among available courses, take the highest-numbered one first
+    priority_order = topological_sort_kahn_priority(courses, {c: -c for c in courses})
+    print(f"Highest-numbered first:      {priority_order}")
+    
     # Example 2: Build dependencies
     print("\n" + "=" * 60)
     print("Example 2: Build System Dependencies")
@@ -236,11 +490,11 @@ if __name__ == "__main__":
     }
     
     print("Graph with cycle: 0 -> 1 -> 2 -> 0")
-    result = topological_sort_kahn(cyclic_graph)
+    result, had_cycle = topological_sort_kahn_or_none(cyclic_graph)
     
-    if result is None:
+    if had_cycle:
         print("✓ Correctly detected: Cannot perform topological sort (cycle exists)")
-        print(f"  has_cycle() returns: {has_cycle(cyclic_graph)}")
+        print(f"  Order returned: {result}")
     
     # Example 4: All topological orderings
     print("\n" + "=" * 60)
@@ -252,7 +506,6 @@ if __name__ == "__main__":
     }
     
     print("DAG: 0 -> 2, 1 -> 2")
-    all_orders = all_topological_sorts(small_dag)
-    print(f"All valid topological orderings ({len(all_orders)} total):")
-    for order in all_orders:
+    print(f"All valid topological orderings ({count_topological_sorts(small_dag)} total):")
+    for order in all_topological_sorts(small_dag):
         print(f"  {order}")
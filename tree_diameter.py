@@ -3,13 +3,19 @@ calculate the diameter of a tree.
 the diameter is defined as the length of the longest path between any two nodes in the tree.
 functions:
 - tree_diameter(root: TreeNode) -> int
-- height_and_diameter(node: TreeNode) -> int
+- tree_to_csr(root: TreeNode) -> Tuple[array, array]
+- tree_diameter_csr(indptr: array, indices: array) -> int
 
-tree_diameter: Calculate the diameter of the tree.
-height_and_diameter: Helper function to compute height and update diameter.
+tree_diameter: Calculate the diameter of the tree from the heights of each
+node's two tallest subtrees, computed bottom-up over a breadth-first order.
+tree_to_csr: Number the nodes breadth-first and store the children as flat arrays.
+tree_diameter_csr: The same diameter computation over those arrays.
 
 """
 
+from array import array
+from typing import Tuple
+
 class TreeNode:
     def __init__(self, value):
         self.value = value
@@ -17,28 +23,94 @@ class TreeNode:
 
 def tree_diameter(root: TreeNode) -> int:
     """Calculate the diameter of the tree."""
-    diameter = 0
+    if root is None:
+        return 0
 
-    def height_and_diameter(node: TreeNode) -> int:
-        nonlocal diameter
-        if not node:
-            return 0
+    # Breadth-first order: a node's children are appended as one block, so the
+    # children of nodes[i] are exactly nodes[first[i]:first[i + 1]]
+    nodes = [root]
+    first = [1]
+    for node in nodes:
+        nodes += node.children
+        first.append(len(nodes))
+
+    # Every child comes after its parent, so walking the order backwards sees
+    # each subtree complete before its root, with no stack or recursion
+    heights = [1] * len(nodes)
+    diameter = 0
+    for i in range(len(nodes) - 1, -1, -1):
+        lo = first[i]
+        hi = first[i + 1]
+        if hi - lo > 1:
+            # The top two child heights, picked by one C-level sort of the
+            # block rather than a compare-and-shift branch per child
+            child_heights = heights[lo:hi]
+            child_heights.sort()
+            m0 = child_heights[-1]
+            m1 = child_heights[-2]
+        elif hi > lo:
+            m0 = heights[lo]
+            m1 = 0
+        else:
+            continue  # A leaf keeps height 1
         
-        max_heights = [0, 0]  # Store the top two heights
-        for child in node.children:
-            child_height = height_and_diameter(child)
-            if child_height > max_heights[0]:
-                max_heights[1] = max_heights[0]
-                max_heights[0] = child_height
-            elif child_height > max_heights[1]:
-                max_heights[1] = child_height
+        # Update the diameter if the path through this node is larger
+        if m0 + m1 > diameter:
+            diameter = m0 + m1
+        
+        heights[i] = m0 + 1  # Height of the current node
+
+    return diameter
+
+def tree_to_csr(root: TreeNode) -> Tuple[array, array]:
+    """
+    Convert a TreeNode tree to CSR arrays (indptr, indices).
+
+    Nodes are numbered breadth-first from the root (id 0), and the children
+    of node i are indices[indptr[i]:indptr[i + 1]]. Every child gets a larger
+    id than its parent, which is what tree_diameter_csr relies on. Walking
+    the node objects is the expensive part, so convert once and keep the
+    arrays when a tree is queried repeatedly.
+    """
+    if root is None:
+        return array('i', [0]), array('i')
+    nodes = [root]
+    indptr = [0]
+    for node in nodes:
+        nodes += node.children
+        indptr.append(len(nodes) - 1)
+    return array('i', indptr), array('i', range(1, len(nodes)))
+
+def tree_diameter_csr(indptr: array, indices: array) -> int:
+    """
+    Calculate the diameter of a tree stored as CSR arrays rooted at id 0.
+
+    Children must have larger ids than their parents (any breadth-first or
+    pre-order numbering, such as tree_to_csr's), so a single backwards scan
+    finishes every subtree before its root, exactly as in tree_diameter.
+    """
+    heights = [1] * (len(indptr) - 1)
+    diameter = 0
+    for i in range(len(heights) - 1, -1, -1):
+        lo = indptr[i]
+        hi = indptr[i + 1]
+        if hi - lo > 1:
+            child_heights = [heights[c] for c in indices[lo:hi]]
+            child_heights.sort()
+            m0 = child_heights[-1]
+            m1 = child_heights[-2]
+        elif hi > lo:
+            m0 = heights[indices[lo]]
+            m1 = 0
+        else:
+            continue  # A leaf keeps height 1
         
         # Update the diameter if the path through this node is larger
-        diameter = max(diameter, max_heights[0] + max_heights[1])
+        if m0 + m1 > diameter:
+            diameter = m0 + m1
         
-        return max_heights[0] + 1  # Height of the current node
+        heights[i] = m0 + 1  # Height of the current node
 
-    height_and_diameter(root)
     return diameter
 
 # Example usage:
@@ -54,5 +126,9 @@ if __name__ == "__main__":
 
     print("Diameter of the tree:", tree_diameter(root))
 
+    # The same tree as flat arrays, for repeated queries
+    indptr, indices = tree_to_csr(root)
+    print("Diameter from CSR arrays:", tree_diameter_csr(indptr, indices))
+
 
 